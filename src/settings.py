@@ -38,6 +38,27 @@ class Settings:
     OTEL_EXPORTER_CLOUDWATCH_REGION: str = os.getenv(
         "OTEL_EXPORTER_CLOUDWATCH_REGION", "us-east-1"
     )
+    
+    # OTLP trace collector; spans are only exported over OTLP when one is set
+    OTEL_EXPORTER_OTLP_TRACES_ENDPOINT: Optional[str] = (
+        os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT") or
+        os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    )
+    
+    # Batch span processor tuning (standard OTEL_BSP_* variables)
+    OTEL_BSP_MAX_QUEUE_SIZE: int = int(os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "4096"))
+    OTEL_BSP_SCHEDULE_DELAY: int = int(os.getenv("OTEL_BSP_SCHEDULE_DELAY", "1000"))
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE: int = int(
+        os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "256")
+    )
+    OTEL_BSP_EXPORT_TIMEOUT: int = int(os.getenv("OTEL_BSP_EXPORT_TIMEOUT", "10000"))
+    
+    # Fraction of new traces to sample; child spans follow their parent
+    OTEL_TRACES_SAMPLER_ARG: float = float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "0.1"))
+    
+    # Test mode keeps spans in memory, samples every trace and skips
+    # CloudWatch exporters
+    OBS_TEST_MODE: bool = os.getenv("OBS_TEST_MODE", "false").lower() in ("1", "true")
 
 
 # Global settings instance
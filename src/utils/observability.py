@@ -2,13 +2,18 @@
 
 import os
 import logging
-from typing import Optional, Dict, Any
-from functools import wraps
+import uuid
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, Mapping, Tuple
+from functools import wraps, lru_cache
 import time
 
 try:
     from opentelemetry import trace, metrics
     from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
     from opentelemetry.sdk.metrics import MeterProvider
     from opentelemetry.sdk.resources import Resource
     from opentelemetry.exporter.cloudwatch.logs import CloudWatchLogsExporter
@@ -22,6 +27,22 @@ except ImportError:
     trace = None
     metrics = None
 
+try:
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+except ImportError:
+    OTLPSpanExporter = None
+
+try:
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    InMemorySpanExporter = None
+
+try:
+    from opentelemetry import propagate
+    from opentelemetry.propagators.aws import AwsXRayPropagator
+except ImportError:
+    AwsXRayPropagator = None
+
 try:
     from ..settings import settings
 except ImportError:
@@ -33,6 +54,29 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Correlation context of the current request. The mapping is read-only so
+# it can be handed out as-is instead of being copied on every read.
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+_correlation_context: ContextVar[Mapping[str, Any]] = ContextVar(
+    "correlation_context", default=_EMPTY_CONTEXT
+)
+
+# The context is passed to logging as ``extra``, which must not overwrite
+# the attributes logging sets on every LogRecord
+_RESERVED_LOG_KEYS = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+
+@lru_cache(maxsize=1)
+def _aws_credentials_available() -> bool:
+    """Probe for AWS credentials once per process."""
+    return bool(
+        (settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY) or
+        os.getenv("AWS_PROFILE") or
+        os.path.exists(os.path.expanduser("~/.aws/credentials"))
+    )
+
 
 class ObservabilityManager:
     """Manager for OpenTelemetry observability setup."""
@@ -42,6 +86,9 @@ class ObservabilityManager:
         self.tracer = None
         self.meter = None
         self.is_initialized = False
+        self.xray_propagator_active = False
+        self.span_exporter = None
+        self._counters: Dict[str, Any] = {}
         
         if OTEL_AVAILABLE:
             self._setup_observability()
@@ -58,8 +105,19 @@ class ObservabilityManager:
                 "deployment.environment": "development" if settings.DEBUG else "production"
             })
             
-            # Set up tracing
-            trace_provider = TracerProvider(resource=resource)
+            # Propagate trace context in X-Ray format for AWS services
+            if AwsXRayPropagator is not None:
+                propagate.set_global_textmap(AwsXRayPropagator())
+                self.xray_propagator_active = True
+            
+            # Set up tracing; test mode samples every trace so tests can
+            # rely on their spans being exported
+            sample_ratio = 1.0 if settings.OBS_TEST_MODE else settings.OTEL_TRACES_SAMPLER_ARG
+            trace_provider = TracerProvider(
+                resource=resource,
+                sampler=ParentBasedTraceIdRatio(sample_ratio)
+            )
+            self._setup_span_export(trace_provider)
             trace.set_tracer_provider(trace_provider)
             self.tracer = trace.get_tracer(__name__)
             
@@ -69,7 +127,7 @@ class ObservabilityManager:
             self.meter = metrics.get_meter(__name__)
             
             # Set up logging (if CloudWatch credentials are available)
-            if self._has_aws_credentials():
+            if not settings.OBS_TEST_MODE and self._has_aws_credentials():
                 self._setup_cloudwatch_logging()
             
             # Auto-instrument common libraries
@@ -81,13 +139,41 @@ class ObservabilityManager:
         except Exception as e:
             logger.error(f"Failed to initialize observability: {e}")
     
+    def _setup_span_export(self, trace_provider) -> None:
+        """Attach a batching span processor so export stays off the request path.
+        
+        In test mode spans go to an in-memory exporter, kept on
+        ``self.span_exporter`` so tests can inspect what was exported.
+        """
+        if settings.OBS_TEST_MODE:
+            exporter_class = InMemorySpanExporter
+        elif settings.OTEL_EXPORTER_OTLP_TRACES_ENDPOINT:
+            exporter_class = OTLPSpanExporter
+        else:
+            # Without a configured collector the OTLP exporter would retry
+            # localhost on every batch, so leave spans unexported instead
+            logger.debug("No OTLP endpoint configured; spans will not be exported")
+            return
+        
+        if exporter_class is None:
+            logger.debug("No span exporter installed; spans will not be exported")
+            return
+        
+        try:
+            self.span_exporter = exporter_class()
+            trace_provider.add_span_processor(BatchSpanProcessor(
+                self.span_exporter,
+                max_queue_size=settings.OTEL_BSP_MAX_QUEUE_SIZE,
+                schedule_delay_millis=settings.OTEL_BSP_SCHEDULE_DELAY,
+                max_export_batch_size=settings.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+                export_timeout_millis=settings.OTEL_BSP_EXPORT_TIMEOUT
+            ))
+        except Exception as e:
+            logger.warning(f"Span export setup failed: {e}")
+    
     def _has_aws_credentials(self) -> bool:
         """Check if AWS credentials are available."""
-        return bool(
-            (settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY) or
-            os.getenv("AWS_PROFILE") or
-            os.path.exists(os.path.expanduser("~/.aws/credentials"))
-        )
+        return _aws_credentials_available()
     
     def _setup_cloudwatch_logging(self) -> None:
         """Set up CloudWatch logging export."""
@@ -122,6 +208,27 @@ class ObservabilityManager:
         except Exception as e:
             logger.warning(f"CloudWatch logging setup failed: {e}")
     
+    def start_request_context(self, operation_name: str, **attributes: Any) -> str:
+        """Start a correlation context for a request and return its ID.
+        
+        Raises ValueError if an attribute name would clash with the context's
+        own keys or with a LogRecord attribute, since the context is logged
+        as ``extra`` by log_with_correlation.
+        """
+        reserved = (_RESERVED_LOG_KEYS | {"correlation_id", "operation"}).intersection(attributes)
+        if reserved:
+            raise ValueError(
+                f"Reserved correlation context attribute(s): {', '.join(sorted(reserved))}"
+            )
+        
+        correlation_id = str(uuid.uuid4())
+        _correlation_context.set(MappingProxyType({
+            "correlation_id": correlation_id,
+            "operation": operation_name,
+            **attributes
+        }))
+        return correlation_id
+    
     def create_span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
         """Create a new span for tracing."""
         if not self.is_initialized or not self.tracer:
@@ -140,10 +247,27 @@ class ObservabilityManager:
             return
         
         try:
-            counter = self.meter.create_counter(name)
-            counter.add(value, attributes or {})
+            self._get_counter(name).add(value, attributes or {})
         except Exception as e:
             logger.debug(f"Failed to record metric {name}: {e}")
+    
+    def record_batch(self, records: Iterable[Tuple[str, float, Optional[Dict[str, str]]]]):
+        """Record several (name, value, attributes) metric values in one call."""
+        if not self.is_initialized or not self.meter:
+            return
+        
+        for name, value, attributes in records:
+            try:
+                self._get_counter(name).add(value, attributes or {})
+            except Exception as e:
+                logger.debug(f"Failed to record metric {name}: {e}")
+    
+    def _get_counter(self, name: str):
+        """Return the counter for a metric, creating it on first use."""
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters[name] = self.meter.create_counter(name)
+        return counter
 
 
 class DummySpan:
@@ -204,10 +328,16 @@ def trace_function(operation_name: str, attributes: Optional[Dict[str, Any]] = N
     return decorator
 
 
+def get_correlation_context() -> Mapping[str, Any]:
+    """Return the read-only correlation context of the current request."""
+    return _correlation_context.get()
+
+
 def log_with_correlation(message: str, level: int = logging.INFO, **kwargs):
     """Log message with correlation context."""
     extra_data = {
         "service.name": settings.OTEL_SERVICE_NAME,
+        **_correlation_context.get(),
         **kwargs
     }
     
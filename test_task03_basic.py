@@ -1,10 +1,150 @@
 #!/usr/bin/env python3
 """Basic validation test for Task 03 without requiring external libraries."""
 
+import hashlib
+import json
 import os
 import sys
 import ast
 import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from validation_helpers import (
+    FAIL_FAST, HELPERS_FILE, results_cache_path, run_tests, write_cache_file
+)
+
+SOURCE_FILE = "src/services/web_scraper.py"
+
+@lru_cache(maxsize=1)
+def _load_source():
+    """Read the web scraper source once per run."""
+    with open(SOURCE_FILE, "r") as f:
+        return f.read()
+
+@lru_cache(maxsize=1)
+def _load_source_bytes():
+    """Return the source and its lower-cased form encoded for byte-level scans."""
+    source = _load_source()
+    return source.encode("utf-8"), source.lower().encode("utf-8")
+
+@lru_cache(maxsize=None)
+def _has(needle, ignore_case=False):
+    """Return True if ``needle`` occurs in the source; each needle is scanned once."""
+    source, lowered = _load_source_bytes()
+    return needle.encode("utf-8") in (lowered if ignore_case else source)
+
+def _count(needle):
+    """Count non-overlapping occurrences of ``needle`` in the source."""
+    return _load_source_bytes()[0].count(needle.encode("utf-8"))
+
+def check_group(specs):
+    """Evaluate ``(feature, check)`` pairs and report whether all are present.
+
+    Under FAIL_FAST the per-feature report is skipped and evaluation
+    stops at the first missing feature.
+    """
+    if FAIL_FAST:
+        return all(check() for _, check in specs)
+    
+    missing_features = []
+    for feature, check in specs:
+        if check():
+            print(f"✅ {feature}")
+        else:
+            print(f"❌ {feature}")
+            missing_features.append(feature)
+    
+    return len(missing_features) == 0
+
+class ValidationResult(NamedTuple):
+    """Outcome of a single validation test."""
+    name: str
+    ok: bool
+
+REQUIRED_METHODS = (
+    'fetch_page_content',
+    'get_session_info',
+    '_validate_url',
+    '_rate_limit',
+    '_parse_html_content',
+    '_extract_title',
+    '_extract_main_content',
+    '_extract_structured_data',
+    '_detect_recipe_indicators'
+)
+
+WEB_SCRAPING_FEATURES = (
+    ("requests library", lambda: _has("import requests")),
+    ("BeautifulSoup", lambda: _has("from bs4 import BeautifulSoup")),
+    ("URL parsing", lambda: _has("from urllib.parse import")),
+    ("Session management", lambda: _has("self.session = requests.Session()")),
+    ("User agent rotation", lambda: _has("USER_AGENTS")),
+    ("Rate limiting", lambda: _has("_rate_limit") and _has("WEB_SCRAPER_DELAY")),
+    ("Timeout handling", lambda: _has("timeout=")),
+    ("Retry strategy", lambda: _has("Retry")),
+    ("HTTP adapters", lambda: _has("HTTPAdapter")),
+)
+
+CONTENT_EXTRACTION_FEATURES = (
+    ("Title extraction", lambda: _has("_extract_title")),
+    ("Main content extraction", lambda: _has("_extract_main_content")),
+    ("Meta description", lambda: _has("_extract_meta_description")),
+    ("Structured data (JSON-LD)", lambda: _has("json-ld", ignore_case=True)),
+    ("Microdata extraction", lambda: _has("_extract_microdata")),
+    ("Recipe indicators", lambda: _has("_detect_recipe_indicators")),
+    ("Content cleaning", lambda: _has("_clean_text")),
+    ("Link extraction", lambda: _has("_extract_links")),
+    ("Image extraction", lambda: _has("_extract_images")),
+    ("Content selectors", lambda: _has("content_selectors")),
+)
+
+ERROR_HANDLING_FEATURES = (
+    ("requests.exceptions.Timeout", lambda: _has("requests.exceptions.Timeout")),
+    ("requests.exceptions.ConnectionError", lambda: _has("requests.exceptions.ConnectionError")),
+    ("requests.exceptions.HTTPError", lambda: _has("requests.exceptions.HTTPError")),
+    ("URL validation", lambda: _has("_validate_url")),
+    ("Try-except blocks", lambda: _count("try:") >= 3),
+    ("Error logging", lambda: _has("logger.error")),
+    ("User-friendly error messages", lambda: _has("raise RuntimeError")),
+    ("HTTP status handling", lambda: _has("status_code") and _has("404")),
+    ("Timeout error messages", lambda: _has("timeout", ignore_case=True) and _has("too long", ignore_case=True)),
+)
+
+RECIPE_FEATURES = (
+    ("Recipe microdata detection", lambda: _has("Recipe") and _has("itemtype")),
+    ("JSON-LD recipe detection", lambda: _has("Recipe") and _has("json-ld", ignore_case=True)),
+    ("Ingredient keywords", lambda: _has("ingredients") and _has("cups")),
+    ("Instruction keywords", lambda: _has("instructions") and _has("directions")),
+    ("Recipe keywords", lambda: _has("recipe") and _has("cook") and _has("bake")),
+    ("Confidence scoring", lambda: _has("confidence_score")),
+    ("Recipe selectors", lambda: _has("recipe-content") or _has("recipe-card")),
+    ("Structured data extraction", lambda: _has("structured_data")),
+    ("Content indicators", lambda: _has("has_ingredient_list") and _has("has_instructions")),
+)
+
+SECURITY_FEATURES = (
+    ("URL scheme validation", lambda: _has("http") and _has("https")),
+    ("Local URL blocking", lambda: _has("localhost") and _has("127.0.0.1")),
+    ("Rate limiting", lambda: _has("time.sleep") and _has("_rate_limit")),
+    ("User agent rotation", lambda: _has("current_user_agent_index")),
+    ("Polite headers", lambda: _has("User-Agent") and _has("Accept")),
+    ("Content type checking", lambda: _has("content-type")),
+    ("Request timeouts", lambda: _has("timeout=")),
+    ("Connection limits", lambda: _has("max_retries")),
+    ("Respectful delays", lambda: _has("WEB_SCRAPER_DELAY")),
+)
+
+OBSERVABILITY_FEATURES = (
+    ("trace_function decorator", lambda: _has("@trace_function")),
+    ("Observability imports", lambda: _has("obs_manager")),
+    ("Metrics recording", lambda: _has("record_metric")),
+    ("Success/failure tracking", lambda: _has("success") and _has("false")),
+    ("Response time metrics", lambda: _has("response_time")),
+    ("Domain-specific metrics", lambda: _has("domain")),
+    ("Error categorization", lambda: _has("error") and _has("timeout")),
+    ("Comprehensive logging", lambda: _count("logger.") >= 5),
+)
 
 def test_implementation_requirements():
     """Test that the implementation meets Task 03 requirements."""
@@ -12,8 +152,7 @@ def test_implementation_requirements():
     print("=" * 50)
     
     try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
+        content = _load_source()
         
         # Parse AST to analyze structure
         tree = ast.parse(content)
@@ -32,25 +171,13 @@ def test_implementation_requirements():
         print("✅ WebScraperService class found")
         
         # Check for required methods
-        required_methods = [
-            'fetch_page_content',
-            'get_session_info',
-            '_validate_url',
-            '_rate_limit',
-            '_parse_html_content',
-            '_extract_title',
-            '_extract_main_content',
-            '_extract_structured_data',
-            '_detect_recipe_indicators'
-        ]
-        
-        found_methods = []
-        for node in scraper_class.body:
-            if isinstance(node, ast.FunctionDef):
-                found_methods.append(node.name)
+        found_methods = {
+            node.name for node in scraper_class.body
+            if isinstance(node, ast.FunctionDef)
+        }
         
         missing_methods = []
-        for method in required_methods:
+        for method in REQUIRED_METHODS:
             if method in found_methods:
                 print(f"✅ {method} method implemented")
             else:
@@ -63,215 +190,62 @@ def test_implementation_requirements():
         print(f"❌ Error analyzing implementation: {e}")
         return False
 
-def test_web_scraping_features():
-    """Test that web scraping features are properly implemented."""
-    print("\n🧪 Testing Web Scraping Features")
-    print("=" * 40)
-    
-    try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
-        
-        scraping_features = {
-            "requests library": "import requests" in content,
-            "BeautifulSoup": "from bs4 import BeautifulSoup" in content,
-            "URL parsing": "from urllib.parse import" in content,
-            "Session management": "self.session = requests.Session()" in content,
-            "User agent rotation": "USER_AGENTS" in content,
-            "Rate limiting": "_rate_limit" in content and "WEB_SCRAPER_DELAY" in content,
-            "Timeout handling": "timeout=" in content,
-            "Retry strategy": "Retry" in content,
-            "HTTP adapters": "HTTPAdapter" in content
-        }
-        
-        missing_features = []
-        for feature, present in scraping_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking scraping features: {e}")
-        return False
-
-def test_content_extraction_features():
-    """Test content extraction and parsing features."""
-    print("\n🧪 Testing Content Extraction Features")
-    print("=" * 45)
-    
-    try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
-        
-        extraction_features = {
-            "Title extraction": "_extract_title" in content,
-            "Main content extraction": "_extract_main_content" in content,
-            "Meta description": "_extract_meta_description" in content,
-            "Structured data (JSON-LD)": "json-ld" in content.lower(),
-            "Microdata extraction": "_extract_microdata" in content,
-            "Recipe indicators": "_detect_recipe_indicators" in content,
-            "Content cleaning": "_clean_text" in content,
-            "Link extraction": "_extract_links" in content,
-            "Image extraction": "_extract_images" in content,
-            "Content selectors": "content_selectors" in content
-        }
+def make_feature_test(name, header, width, error_label, specs, doc):
+    """Build a feature test that prints a section header and checks ``specs``."""
+    def feature_test():
+        print(f"\n🧪 Testing {header}")
+        print("=" * width)
         
-        missing_features = []
-        for feature, present in extraction_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking extraction features: {e}")
-        return False
-
-def test_error_handling_implementation():
-    """Test error handling implementation."""
-    print("\n🧪 Testing Error Handling Implementation")
-    print("=" * 45)
-    
-    try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
-        
-        error_handling_features = {
-            "requests.exceptions.Timeout": "requests.exceptions.Timeout" in content,
-            "requests.exceptions.ConnectionError": "requests.exceptions.ConnectionError" in content,
-            "requests.exceptions.HTTPError": "requests.exceptions.HTTPError" in content,
-            "URL validation": "_validate_url" in content,
-            "Try-except blocks": content.count("try:") >= 3,
-            "Error logging": "logger.error" in content,
-            "User-friendly error messages": "raise RuntimeError" in content,
-            "HTTP status handling": "status_code" in content and "404" in content,
-            "Timeout error messages": "timeout" in content.lower() and "too long" in content.lower()
-        }
-        
-        missing_features = []
-        for feature, present in error_handling_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking error handling: {e}")
-        return False
-
-def test_recipe_specific_features():
-    """Test recipe-specific detection features."""
-    print("\n🧪 Testing Recipe-Specific Features")
-    print("=" * 40)
+        try:
+            return check_group(specs)
+        except Exception as e:
+            print(f"❌ Error checking {error_label}: {e}")
+            return False
     
-    try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
-        
-        recipe_features = {
-            "Recipe microdata detection": "Recipe" in content and "itemtype" in content,
-            "JSON-LD recipe detection": "Recipe" in content and "json-ld" in content.lower(),
-            "Ingredient keywords": "ingredients" in content and "cups" in content,
-            "Instruction keywords": "instructions" in content and "directions" in content,
-            "Recipe keywords": "recipe" in content and "cook" in content and "bake" in content,
-            "Confidence scoring": "confidence_score" in content,
-            "Recipe selectors": "recipe-content" in content or "recipe-card" in content,
-            "Structured data extraction": "structured_data" in content,
-            "Content indicators": "has_ingredient_list" in content and "has_instructions" in content
-        }
-        
-        missing_features = []
-        for feature, present in recipe_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking recipe features: {e}")
-        return False
+    feature_test.__name__ = feature_test.__qualname__ = name
+    feature_test.__doc__ = doc
+    return feature_test
 
-def test_security_and_politeness():
-    """Test security and politeness features."""
-    print("\n🧪 Testing Security & Politeness Features")
-    print("=" * 45)
-    
-    try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
-        
-        security_features = {
-            "URL scheme validation": "http" in content and "https" in content,
-            "Local URL blocking": "localhost" in content and "127.0.0.1" in content,
-            "Rate limiting": "time.sleep" in content and "_rate_limit" in content,
-            "User agent rotation": "current_user_agent_index" in content,
-            "Polite headers": "User-Agent" in content and "Accept" in content,
-            "Content type checking": "content-type" in content,
-            "Request timeouts": "timeout=" in content,
-            "Connection limits": "max_retries" in content,
-            "Respectful delays": "WEB_SCRAPER_DELAY" in content
-        }
-        
-        missing_features = []
-        for feature, present in security_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking security features: {e}")
-        return False
+test_web_scraping_features = make_feature_test(
+    "test_web_scraping_features", "Web Scraping Features", 40,
+    "scraping features", WEB_SCRAPING_FEATURES,
+    "Test that web scraping features are properly implemented."
+)
+test_content_extraction_features = make_feature_test(
+    "test_content_extraction_features", "Content Extraction Features", 45,
+    "extraction features", CONTENT_EXTRACTION_FEATURES,
+    "Test content extraction and parsing features."
+)
+test_error_handling_implementation = make_feature_test(
+    "test_error_handling_implementation", "Error Handling Implementation", 45,
+    "error handling", ERROR_HANDLING_FEATURES,
+    "Test error handling implementation."
+)
+test_recipe_specific_features = make_feature_test(
+    "test_recipe_specific_features", "Recipe-Specific Features", 40,
+    "recipe features", RECIPE_FEATURES,
+    "Test recipe-specific detection features."
+)
+test_security_and_politeness = make_feature_test(
+    "test_security_and_politeness", "Security & Politeness Features", 45,
+    "security features", SECURITY_FEATURES,
+    "Test security and politeness features."
+)
+test_observability_integration = make_feature_test(
+    "test_observability_integration", "Observability Integration", 40,
+    "observability", OBSERVABILITY_FEATURES,
+    "Test observability integration."
+)
 
-def test_observability_integration():
-    """Test observability integration."""
-    print("\n🧪 Testing Observability Integration")
-    print("=" * 40)
-    
-    try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
-        
-        observability_features = {
-            "trace_function decorator": "@trace_function" in content,
-            "Observability imports": "obs_manager" in content,
-            "Metrics recording": "record_metric" in content,
-            "Success/failure tracking": "success" in content and "false" in content,
-            "Response time metrics": "response_time" in content,
-            "Domain-specific metrics": "domain" in content,
-            "Error categorization": "error" in content and "timeout" in content,
-            "Comprehensive logging": content.count("logger.") >= 5
-        }
-        
-        missing_features = []
-        for feature, present in observability_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking observability: {e}")
-        return False
+# Feature tests in report order, as (summary name, test function).
+FEATURE_TESTS = (
+    ("Web Scraping Features", test_web_scraping_features),
+    ("Content Extraction Features", test_content_extraction_features),
+    ("Error Handling", test_error_handling_implementation),
+    ("Recipe-Specific Features", test_recipe_specific_features),
+    ("Security & Politeness", test_security_and_politeness),
+    ("Observability Integration", test_observability_integration)
+)
 
 def test_method_signatures():
     """Test that method signatures match requirements."""
@@ -279,8 +253,7 @@ def test_method_signatures():
     print("=" * 35)
     
     try:
-        with open("src/services/web_scraper.py", "r") as f:
-            content = f.read()
+        content = _load_source()
         
         # Check fetch_page_content signature
         fetch_method_match = re.search(
@@ -292,7 +265,7 @@ def test_method_signatures():
             print("✅ fetch_page_content method signature correct")
             
             # Check for url parameter
-            if "url: str" in content:
+            if _has("url: str"):
                 print("  ✅ url parameter with type annotation")
             else:
                 print("  ❌ url parameter missing or no type annotation")
@@ -302,7 +275,7 @@ def test_method_signatures():
             return False
         
         # Check get_session_info signature
-        if "def get_session_info(self) -> Dict[str, Any]:" in content:
+        if _has("def get_session_info(self) -> Dict[str, Any]:"):
             print("✅ get_session_info method signature correct")
         else:
             print("❌ get_session_info method signature incorrect")
@@ -338,11 +311,11 @@ def test_task03_completeness():
     
     # Check implementation details from requirements
     implementation_details = {
-        "Requests library with session": "requests.Session" in open("src/services/web_scraper.py").read(),
-        "User-agent rotation": "USER_AGENTS" in open("src/services/web_scraper.py").read(),
-        "Timeout and retry logic": "timeout" in open("src/services/web_scraper.py").read() and "Retry" in open("src/services/web_scraper.py").read(),
-        "Structured data extraction": "json-ld" in open("src/services/web_scraper.py").read().lower(),
-        "Recipe website patterns": "recipe" in open("src/services/web_scraper.py").read().lower()
+        "Requests library with session": _has("requests.Session"),
+        "User-agent rotation": _has("USER_AGENTS"),
+        "Timeout and retry logic": _has("timeout") and _has("Retry"),
+        "Structured data extraction": _has("json-ld", ignore_case=True),
+        "Recipe website patterns": _has("recipe", ignore_case=True)
     }
     
     for detail, present in implementation_details.items():
@@ -354,60 +327,135 @@ def test_task03_completeness():
     
     return all_complete
 
+def _results_cache_path():
+    """Return the results cache file for the current source and validator.
+    
+    The key covers web_scraper.py, this script and validation_helpers.py,
+    so editing any of them invalidates earlier results. Returns None if
+    one of them can't be read.
+    """
+    try:
+        digest = hashlib.sha256(_load_source_bytes()[0])
+        for path in (__file__, HELPERS_FILE):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    except OSError:
+        return None
+    return results_cache_path(f"task03_{digest.hexdigest()}.json")
+
+def _load_cached_results(cache_path):
+    """Load cached ``{test_name: result}`` data, or None on a cache miss.
+    
+    Only all-pass runs are reused: a cached failure would print the FAIL
+    rows without the check output that says what is missing.
+    """
+    if not cache_path:
+        return None
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or not all(v is True for v in cached.values()):
+        return None
+    return cached
+
+STAMP_FILE = results_cache_path("task03.stamp")
+
+def _stat_signature():
+    """Return (path, mtime_ns, size) for the source, this script and the helpers.
+    
+    Returns None if any of them can't be stat'ed.
+    """
+    signature = []
+    for path in (SOURCE_FILE, __file__, HELPERS_FILE):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        signature.append([os.path.abspath(path), st.st_mtime_ns, st.st_size])
+    return signature
+
+def _stamp_is_fresh(signature):
+    """Check whether the last run passed against files with the same stat data."""
+    if signature is None:
+        return False
+    try:
+        with open(STAMP_FILE, "r") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return stamp.get("passed") is True and stamp.get("files") == signature
+
 if __name__ == "__main__":
     print("🧪 Task 03 Basic Validation: Web Scraper Service")
     print("=" * 55)
     
     tests = [
         ("Implementation Requirements", test_implementation_requirements),
-        ("Web Scraping Features", test_web_scraping_features),
-        ("Content Extraction Features", test_content_extraction_features),
-        ("Error Handling", test_error_handling_implementation),
-        ("Recipe-Specific Features", test_recipe_specific_features),
-        ("Security & Politeness", test_security_and_politeness),
-        ("Observability Integration", test_observability_integration),
+        *FEATURE_TESTS,
         ("Method Signatures", test_method_signatures),
         ("Task 03 Completeness", test_task03_completeness)
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ {test_name} failed with error: {e}")
-            results.append(False)
+    # Cheapest path first: a stat() of the source, this script and the
+    # helpers is enough to tell that nothing changed since the last passing
+    # run.
+    force = "--force" in sys.argv
+    signature = _stat_signature()
+    if not force and _stamp_is_fresh(signature):
+        print("✅ cached: all checks passed and the source is unchanged")
+        print("   (run with --force to re-check)")
+        sys.exit(0)
     
-    print("\n" + "=" * 55)
-    print("📊 SUMMARY")
-    print("=" * 55)
+    cache_path = _results_cache_path()
+    cached = None if force else _load_cached_results(cache_path)
+    
+    if cached is not None:
+        print("♻️  Source unchanged since the last run; reusing cached results")
+        print("   (run with --force to re-check)")
+        results = [ValidationResult(name, cached.get(name, False)) for name, _ in tests]
+    else:
+        results = [
+            ValidationResult(test_name, result)
+            for (test_name, _), result in zip(tests, run_tests(tests))
+        ]
+        if cache_path and all(r.ok for r in results):
+            write_cache_file(cache_path, json.dumps({r.name: r.ok for r in results}))
     
-    for i, (test_name, _) in enumerate(tests):
-        status = "✅ PASS" if results[i] else "❌ FAIL"
-        print(f"{status} {test_name}")
+    # Build the summary as one block so it goes out in a single write.
+    lines = ["", "=" * 55, "📊 SUMMARY", "=" * 55]
+    lines.extend(f"{'✅ PASS' if r.ok else '❌ FAIL'} {r.name}" for r in results)
     
-    success_rate = sum(results) / len(results) * 100
-    print(f"\nOverall: {success_rate:.0f}% tests passed")
+    all_passed = all(r.ok for r in results)
+    success_rate = sum(r.ok for r in results) / len(results) * 100
+    lines.append(f"\nOverall: {success_rate:.0f}% tests passed")
     
-    if all(results):
-        print("\n🎉 Task 03 implementation is complete!")
-        print("✅ Web Scraper Service fully implemented with all requirements:")
-        print("   • HTTP/HTTPS URL support with proper headers")
-        print("   • BeautifulSoup4 for HTML parsing and content extraction")
-        print("   • Rate limiting (1 second delay) for polite scraping")
-        print("   • User agent rotation for politeness")
-        print("   • Comprehensive error handling for network failures")
-        print("   • Content sanitization and cleaning")
-        print("   • Support for recipe microdata and JSON-LD formats")
-        print("   • Recipe-specific detection with confidence scoring")
-        print("   • Security validation to prevent local URL access")
-        print("   • Session management with retry logic and timeouts")
-        print("   • OpenTelemetry observability integration")
-        print("\nNote: Runtime testing requires requests and beautifulsoup4 installation.")
-        print("The implementation is structurally complete and ready for use.")
+    if all_passed:
+        lines.extend([
+            "\n🎉 Task 03 implementation is complete!",
+            "✅ Web Scraper Service fully implemented with all requirements:",
+            "   • HTTP/HTTPS URL support with proper headers",
+            "   • BeautifulSoup4 for HTML parsing and content extraction",
+            "   • Rate limiting (1 second delay) for polite scraping",
+            "   • User agent rotation for politeness",
+            "   • Comprehensive error handling for network failures",
+            "   • Content sanitization and cleaning",
+            "   • Support for recipe microdata and JSON-LD formats",
+            "   • Recipe-specific detection with confidence scoring",
+            "   • Security validation to prevent local URL access",
+            "   • Session management with retry logic and timeouts",
+            "   • OpenTelemetry observability integration",
+            "\nNote: Runtime testing requires requests and beautifulsoup4 installation.",
+            "The implementation is structurally complete and ready for use."
+        ])
     else:
-        failed_tests = [tests[i][0] for i, result in enumerate(results) if not result]
-        print(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
+        failed_tests = [r.name for r in results if not r.ok]
+        lines.append(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    if signature is not None:
+        write_cache_file(STAMP_FILE, json.dumps({"files": signature, "passed": all_passed}))
     
-    sys.exit(0 if all(results) else 1)
\ No newline at end of file
+    sys.exit(0 if all_passed else 1)
\ No newline at end of file
@@ -5,6 +5,250 @@ import os
 import sys
 import ast
 import re
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import NamedTuple
+
+from validation_helpers import (
+    AnyOf, AtLeast, encode_literals, find_literals, run_tests
+)
+
+SOURCE_FILE = "src/services/recipe_detector.py"
+
+def _source_key():
+    """Return the ``(path, mtime_ns)`` cache key for the current source file."""
+    return SOURCE_FILE, os.stat(SOURCE_FILE).st_mtime_ns
+
+# The memoized helpers below are keyed on (path, mtime_ns), so repeated
+# calls in one interpreter reuse earlier work until the file is edited.
+@lru_cache(maxsize=8)
+def _read_source(path, mtime_ns):
+    # Substring checks don't need Unicode semantics and ast.parse accepts
+    # bytes, so the source is never decoded to str.
+    return Path(path).read_bytes()
+
+@lru_cache(maxsize=8)
+def _parse_source(path, mtime_ns):
+    return ast.parse(_read_source(path, mtime_ns))
+
+@lru_cache(maxsize=8)
+def _index_classes(path, mtime_ns):
+    # Service classes are defined at module level, so only ``tree.body`` is
+    # visited rather than every node in the file.
+    return {
+        cls.name: frozenset(
+            fn.name for fn in cls.body if isinstance(fn, ast.FunctionDef)
+        )
+        for cls in _parse_source(path, mtime_ns).body
+        if isinstance(cls, ast.ClassDef)
+    }
+
+def _class_index():
+    """Map each top-level class name to the set of its method names."""
+    return _index_classes(*_source_key())
+
+# The hiragana and katakana ranges must appear together in one regex
+# character class, e.g. r'[\u3040-\u309F\u30A0-\u30FF...]'.
+_JAPANESE_RANGE_RE = re.compile(
+    rb"\[[^\]\n]*\\u3040-\\u309F[^\]\n]*\\u30A0-\\u30FF[^\]\n]*\]"
+)
+
+# Each check is a needle string, a tuple of needles that must all be
+# present, an AnyOf, an AtLeast, or a precompiled regex.
+AI_INTEGRATION_CHECKS = {
+    "BedrockService import": AnyOf(("from .bedrock_service import BedrockService", "BedrockService")),
+    "WebScraperService integration": AnyOf(("from .web_scraper import WebScraperService", "WebScraperService")),
+    "AI response parsing": "_parse_ai_response",
+    "JSON response handling": ("json.loads", "json_match"),
+    "Fallback parsing": "_fallback_parse_response",
+    "Prompt creation": "_create_recipe_detection_prompt",
+    "Model invocation": "invoke_model",
+    "Temperature control": "temperature",
+    "Token limits": "max_tokens",
+    "Content length limiting": AnyOf(("[:3000]", "[:4000]"))
+}
+
+LANGUAGE_CHECKS = {
+    "Japanese detection": "_detect_japanese",
+    "Unicode patterns": _JAPANESE_RANGE_RE,
+    "Japanese prompts": "あなたは料理レシピの専門家です",
+    "English prompts": "You are a culinary expert",
+    "Language parameter": "language: str = \"auto\"",
+    "Japanese keywords": ("材料", "レシピ", "作り方"),
+    "Auto detection logic": "language == \"auto\"",
+    "Japanese response format": "\"language\": \"ja\"",
+    "English response format": "\"language\": \"en\"",
+    "Ingredient extraction prompts": "材料リストを抽出してください"
+}
+
+CACHING_CHECKS = {
+    "Cache storage": "_set_cache",
+    "Cache TTL": "_cache_ttl = 3600",
+    "Cache key generation": "_get_cache_key",
+    "MD5 hashing": "hashlib.md5",
+    "Cache retrieval": "_get_from_cache",
+    "TTL validation": "time.time() - cached_data['timestamp'] < self._cache_ttl",
+    "Cache expiration": "del self._cache[cache_key]",
+    "Cache statistics": "get_cache_stats",
+    "Cache clearing": "clear_cache",
+    "Cache hit logging": "Cache hit for key",
+    "Timestamp tracking": "'timestamp': time.time()"
+}
+
+VALIDATION_CHECKS = {
+    "Confidence thresholds": ("recipe_confidence_threshold", "ingredient_confidence_threshold"),
+    "Result validation": ("_validate_detection_result", "_validate_ingredient_result"),
+    "Confidence normalization": "max(0.0, min(1.0",
+    "Threshold application": "< self.recipe_confidence_threshold",
+    "Confidence buckets": "_get_confidence_bucket",
+    "Bucket categories": ("high", "medium", "low", "very_low"),
+    "Ingredient validation": "validated_ingredients",
+    "Name requirement": "ingredient.get(\"name\")",
+    "Data cleaning": ".strip()",
+    "Field existence checks": "result.get("
+}
+
+OUTPUT_CHECKS = {
+    "JSON response format": "\"is_recipe\": true/false",
+    "Confidence field": "\"confidence\": 0.0-1.0",
+    "Ingredient structure": "\"name\": \"ingredient name\"",
+    "Quantity and units": ("\"quantity\":", "\"unit\":"),
+    "Serving size": "\"serving_size\":",
+    "Detection reason": "\"reason\":",
+    "Detected elements": "\"detected_elements\":",
+    "Language identification": "\"language\":",
+    "Ingredient notes": "\"notes\":",
+    "Metadata inclusion": ("processing_time", "timestamp"),
+    "Page metadata": "page_metadata",
+    "Total ingredients": "total_ingredients"
+}
+
+ERROR_HANDLING_CHECKS = {
+    "Exception catching": "except Exception as e:",
+    "JSON decode errors": "json.JSONDecodeError",
+    "Error logging": "logger.error",
+    "Runtime errors": "raise RuntimeError",
+    "Fallback mechanisms": "_fallback_parse_response",
+    "User-friendly messages": AnyOf(("Failed to detect recipe", "Failed to extract ingredients")),
+    "Try-except blocks": AtLeast("try:", 3),
+    "Error metrics": "\"success\": \"false\"",
+    "Error categorization": "\"error\":",
+    "Graceful degradation": "confidence\": 0.5"  # Fallback confidence
+}
+
+OBSERVABILITY_CHECKS = {
+    "trace_function decorator": "@trace_function",
+    "Observability imports": "obs_manager",
+    "Metrics recording": "record_metric",
+    "Success/failure tracking": ("\"success\": \"true\"", "\"success\": \"false\""),
+    "Processing time metrics": "recipe_detector_processing_time",
+    "Operation classification": "\"operation\":",
+    "Detection metrics": "recipe_detector_detection",
+    "Extraction metrics": "recipe_detector_extraction",
+    "Complete analysis metrics": "recipe_detector_complete_analysis",
+    "Confidence bucketing": "confidence_bucket",
+    "Language tracking": "\"language\":",
+    "Ingredient counting": "ingredient_count"
+}
+
+SIGNATURE_CHECKS = {
+    "detect_recipe": "def detect_recipe(self, url: str, language: str = \"auto\") -> Dict[str, Any]:",
+    "extract_ingredients": "def extract_ingredients(self, url: str, language: str = \"auto\") -> Dict[str, Any]:",
+    "analyze_url": "def analyze_url(self, url: str, language: str = \"auto\") -> Dict[str, Any]:",
+    "_detect_japanese": "def _detect_japanese(self, text: str) -> bool:",
+    "get_cache_stats": "def get_cache_stats(self) -> Dict[str, Any]:",
+    "clear_cache": "def clear_cache(self) -> None:"
+}
+
+IMPLEMENTATION_DETAILS = {
+    "LangChain with Bedrock integration": "BedrockService",
+    "Optimized prompts for recipe detection": "あなたは料理レシピの専門家です",
+    "Structured output parsing": "json.loads",
+    "Caching for repeated URLs": ("_cache", "3600"),
+    "Confidence thresholds and validation": "confidence_threshold",
+    "Binary classification": "is_recipe",
+    "Multi-language support": "_detect_japanese",
+    "Fallback parsing for edge cases": "_fallback_parse_response"
+}
+
+ALL_CHECKS = (
+    AI_INTEGRATION_CHECKS, LANGUAGE_CHECKS, CACHING_CHECKS,
+    VALIDATION_CHECKS, OUTPUT_CHECKS, ERROR_HANDLING_CHECKS,
+    OBSERVABILITY_CHECKS, SIGNATURE_CHECKS, IMPLEMENTATION_DETAILS
+)
+
+# UTF-8 encodings of every literal, computed once.
+ENCODED_LITERALS = encode_literals(
+    check for table in ALL_CHECKS for check in table.values()
+)
+
+# Literals whose occurrence count matters, mapped to the highest threshold
+# any check needs. These are counted instead of merely tested, so presence
+# and count come from the same traversal.
+def _collect_count_limits():
+    limits = {}
+    for table in ALL_CHECKS:
+        for check in table.values():
+            if isinstance(check, AtLeast):
+                limits[check.needle] = max(check.count, limits.get(check.needle, 0))
+    return limits
+
+COUNT_LIMITS = _collect_count_limits()
+
+# Literals that only need a presence test.
+UNCOUNTED_LITERALS = {
+    needle: encoded for needle, encoded in ENCODED_LITERALS.items()
+    if needle not in COUNT_LIMITS
+}
+
+def _count_up_to(content, needle, limit):
+    """Count occurrences of ``needle``, stopping as soon as ``limit`` is reached."""
+    count = 0
+    start = content.find(needle)
+    while start != -1 and count < limit:
+        count += 1
+        start = content.find(needle, start + len(needle))
+    return count
+
+class ScanResult(NamedTuple):
+    """The source, the literals found in it, and counts capped at COUNT_LIMITS."""
+    content: bytes
+    matched: frozenset
+    counts: dict
+
+@lru_cache(maxsize=8)
+def _scan_source(path, mtime_ns):
+    content = _read_source(path, mtime_ns)
+    counts = {
+        needle: _count_up_to(content, ENCODED_LITERALS[needle], limit)
+        for needle, limit in COUNT_LIMITS.items()
+    }
+    matched = find_literals(content, UNCOUNTED_LITERALS) | frozenset(
+        needle for needle, count in counts.items() if count
+    )
+    return ScanResult(content, matched, counts)
+
+def _scan():
+    """Traverse the source once per distinct literal, memoized per file version."""
+    return _scan_source(*_source_key())
+
+def clear_caches():
+    """Drop every memoized read, parse and scan of the source."""
+    for cached in (_read_source, _parse_source, _index_classes, _scan_source):
+        cached.cache_clear()
+
+def _evaluate(check, scan):
+    """Evaluate a check against a precomputed scan of the source."""
+    content, matched, counts = scan
+    if isinstance(check, str):
+        return check in matched
+    if isinstance(check, AnyOf):
+        return any(needle in matched for needle in check.needles)
+    if isinstance(check, AtLeast):
+        return counts[check.needle] >= check.count
+    if isinstance(check, re.Pattern):
+        return check.search(content) is not None
+    return all(needle in matched for needle in check)
 
 def test_implementation_requirements():
     """Test that the implementation meets Task 04 requirements."""
@@ -12,20 +256,10 @@ def test_implementation_requirements():
     print("=" * 50)
     
     try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        # Parse AST to analyze structure
-        tree = ast.parse(content)
+        # Look up RecipeDetectorService in the shared class index
+        found_methods = _class_index().get("RecipeDetectorService")
         
-        # Find RecipeDetectorService class
-        detector_class = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == "RecipeDetectorService":
-                detector_class = node
-                break
-        
-        if not detector_class:
+        if found_methods is None:
             print("❌ RecipeDetectorService class not found")
             return False
         
@@ -46,18 +280,13 @@ def test_implementation_requirements():
             'clear_cache'
         ]
         
-        found_methods = []
-        for node in detector_class.body:
-            if isinstance(node, ast.FunctionDef):
-                found_methods.append(node.name)
-        
-        missing_methods = []
         for method in required_methods:
             if method in found_methods:
                 print(f"✅ {method} method implemented")
             else:
                 print(f"❌ {method} method missing")
-                missing_methods.append(method)
+        
+        missing_methods = [m for m in required_methods if m not in found_methods]
         
         return len(missing_methods) == 0
         
@@ -65,31 +294,16 @@ def test_implementation_requirements():
         print(f"❌ Error analyzing implementation: {e}")
         return False
 
-def test_ai_integration_features():
-    """Test AI integration and Bedrock features."""
-    print("\n🧪 Testing AI Integration Features")
-    print("=" * 40)
+def run_checks(name, width, checks, error_label):
+    """Print a section header, then report each feature check in ``checks``."""
+    print(f"\n🧪 Testing {name}")
+    print("=" * width)
     
     try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        ai_features = {
-            "BedrockService import": "from .bedrock_service import BedrockService" in content or "BedrockService" in content,
-            "WebScraperService integration": "from .web_scraper import WebScraperService" in content or "WebScraperService" in content,
-            "AI response parsing": "_parse_ai_response" in content,
-            "JSON response handling": "json.loads" in content and "json_match" in content,
-            "Fallback parsing": "_fallback_parse_response" in content,
-            "Prompt creation": "_create_recipe_detection_prompt" in content,
-            "Model invocation": "invoke_model" in content,
-            "Temperature control": "temperature" in content,
-            "Token limits": "max_tokens" in content,
-            "Content length limiting": "[:3000]" in content or "[:4000]" in content
-        }
-        
+        scan = _scan()
         missing_features = []
-        for feature, present in ai_features.items():
-            if present:
+        for feature, check in checks.items():
+            if _evaluate(check, scan):
                 print(f"✅ {feature}")
             else:
                 print(f"❌ {feature}")
@@ -98,230 +312,24 @@ def test_ai_integration_features():
         return len(missing_features) == 0
         
     except Exception as e:
-        print(f"❌ Error checking AI integration: {e}")
+        print(f"❌ Error checking {error_label}: {e}")
         return False
 
-def test_multi_language_support():
-    """Test multi-language support features."""
-    print("\n🧪 Testing Multi-Language Support")
-    print("=" * 40)
-    
-    try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        language_features = {
-            "Japanese detection": "_detect_japanese" in content,
-            "Unicode patterns": "\\u3040-\\u309F" in content and "\\u30A0-\\u30FF" in content,
-            "Japanese prompts": "あなたは料理レシピの専門家です" in content,
-            "English prompts": "You are a culinary expert" in content,
-            "Language parameter": "language: str = \"auto\"" in content,
-            "Japanese keywords": "材料" in content and "レシピ" in content and "作り方" in content,
-            "Auto detection logic": "language == \"auto\"" in content,
-            "Japanese response format": "\"language\": \"ja\"" in content,
-            "English response format": "\"language\": \"en\"" in content,
-            "Ingredient extraction prompts": "材料リストを抽出してください" in content
-        }
-        
-        missing_features = []
-        for feature, present in language_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking language support: {e}")
-        return False
+# Feature sections in report order: (name, underline width, checks, error label).
+CHECK_TABLE = (
+    ("AI Integration Features", 40, AI_INTEGRATION_CHECKS, "AI integration"),
+    ("Multi-Language Support", 40, LANGUAGE_CHECKS, "language support"),
+    ("Caching Implementation", 35, CACHING_CHECKS, "caching"),
+    ("Confidence & Validation", 40, VALIDATION_CHECKS, "validation"),
+    ("Structured Output", 30, OUTPUT_CHECKS, "structured output"),
+    ("Error Handling", 25, ERROR_HANDLING_CHECKS, "error handling"),
+    ("Observability Integration", 40, OBSERVABILITY_CHECKS, "observability")
+)
 
-def test_caching_implementation():
-    """Test caching functionality."""
-    print("\n🧪 Testing Caching Implementation")
-    print("=" * 35)
-    
-    try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        caching_features = {
-            "Cache storage": "_cache = {}" in content,
-            "Cache TTL": "_cache_ttl = 3600" in content,
-            "Cache key generation": "_get_cache_key" in content,
-            "MD5 hashing": "hashlib.md5" in content,
-            "Cache retrieval": "_get_from_cache" in content,
-            "Cache storage": "_set_cache" in content,
-            "TTL validation": "time.time() - cached_data['timestamp'] < self._cache_ttl" in content,
-            "Cache expiration": "del self._cache[cache_key]" in content,
-            "Cache statistics": "get_cache_stats" in content,
-            "Cache clearing": "clear_cache" in content,
-            "Cache hit logging": "Cache hit for key" in content,
-            "Timestamp tracking": "'timestamp': time.time()" in content
-        }
-        
-        missing_features = []
-        for feature, present in caching_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking caching: {e}")
-        return False
-
-def test_confidence_and_validation():
-    """Test confidence scoring and validation features."""
-    print("\n🧪 Testing Confidence & Validation")
-    print("=" * 40)
-    
-    try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        validation_features = {
-            "Confidence thresholds": "recipe_confidence_threshold" in content and "ingredient_confidence_threshold" in content,
-            "Result validation": "_validate_detection_result" in content and "_validate_ingredient_result" in content,
-            "Confidence normalization": "max(0.0, min(1.0" in content,
-            "Threshold application": "< self.recipe_confidence_threshold" in content,
-            "Confidence buckets": "_get_confidence_bucket" in content,
-            "Bucket categories": "high" in content and "medium" in content and "low" in content and "very_low" in content,
-            "Ingredient validation": "validated_ingredients" in content,
-            "Name requirement": "ingredient.get(\"name\")" in content,
-            "Data cleaning": ".strip()" in content,
-            "Field existence checks": "result.get(" in content
-        }
-        
-        missing_features = []
-        for feature, present in validation_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking validation: {e}")
-        return False
-
-def test_structured_output():
-    """Test structured output and parsing features."""
-    print("\n🧪 Testing Structured Output")
-    print("=" * 30)
-    
-    try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        output_features = {
-            "JSON response format": "\"is_recipe\": true/false" in content,
-            "Confidence field": "\"confidence\": 0.0-1.0" in content,
-            "Ingredient structure": "\"name\": \"ingredient name\"" in content,
-            "Quantity and units": "\"quantity\":" in content and "\"unit\":" in content,
-            "Serving size": "\"serving_size\":" in content,
-            "Detection reason": "\"reason\":" in content,
-            "Detected elements": "\"detected_elements\":" in content,
-            "Language identification": "\"language\":" in content,
-            "Ingredient notes": "\"notes\":" in content,
-            "Metadata inclusion": "processing_time" in content and "timestamp" in content,
-            "Page metadata": "page_metadata" in content,
-            "Total ingredients": "total_ingredients" in content
-        }
-        
-        missing_features = []
-        for feature, present in output_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking structured output: {e}")
-        return False
-
-def test_error_handling():
-    """Test error handling implementation."""
-    print("\n🧪 Testing Error Handling")
-    print("=" * 25)
-    
-    try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        error_features = {
-            "Exception catching": "except Exception as e:" in content,
-            "JSON decode errors": "json.JSONDecodeError" in content,
-            "Error logging": "logger.error" in content,
-            "Runtime errors": "raise RuntimeError" in content,
-            "Fallback mechanisms": "_fallback_parse_response" in content,
-            "User-friendly messages": "Failed to detect recipe" in content or "Failed to extract ingredients" in content,
-            "Try-except blocks": content.count("try:") >= 3,
-            "Error metrics": "\"success\": \"false\"" in content,
-            "Error categorization": "\"error\":" in content,
-            "Graceful degradation": "confidence\": 0.5" in content  # Fallback confidence
-        }
-        
-        missing_features = []
-        for feature, present in error_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking error handling: {e}")
-        return False
-
-def test_observability_integration():
-    """Test observability integration."""
-    print("\n🧪 Testing Observability Integration")
-    print("=" * 40)
-    
-    try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        observability_features = {
-            "trace_function decorator": "@trace_function" in content,
-            "Observability imports": "obs_manager" in content,
-            "Metrics recording": "record_metric" in content,
-            "Success/failure tracking": "\"success\": \"true\"" in content and "\"success\": \"false\"" in content,
-            "Processing time metrics": "recipe_detector_processing_time" in content,
-            "Operation classification": "\"operation\":" in content,
-            "Detection metrics": "recipe_detector_detection" in content,
-            "Extraction metrics": "recipe_detector_extraction" in content,
-            "Complete analysis metrics": "recipe_detector_complete_analysis" in content,
-            "Confidence bucketing": "confidence_bucket" in content,
-            "Language tracking": "\"language\":" in content,
-            "Ingredient counting": "ingredient_count" in content
-        }
-        
-        missing_features = []
-        for feature, present in observability_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking observability: {e}")
-        return False
+def test_feature_checks():
+    """Run every section of CHECK_TABLE."""
+    results = [run_checks(*section) for section in CHECK_TABLE]
+    return all(results)
 
 def test_method_signatures():
     """Test that method signatures match requirements."""
@@ -329,22 +337,10 @@ def test_method_signatures():
     print("=" * 30)
     
     try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        # Check key method signatures
-        signature_checks = {
-            "detect_recipe": "def detect_recipe(self, url: str, language: str = \"auto\") -> Dict[str, Any]:" in content,
-            "extract_ingredients": "def extract_ingredients(self, url: str, language: str = \"auto\") -> Dict[str, Any]:" in content,
-            "analyze_url": "def analyze_url(self, url: str, language: str = \"auto\") -> Dict[str, Any]:" in content,
-            "_detect_japanese": "def _detect_japanese(self, text: str) -> bool:" in content,
-            "get_cache_stats": "def get_cache_stats(self) -> Dict[str, Any]:" in content,
-            "clear_cache": "def clear_cache(self) -> None:" in content
-        }
-        
+        scan = _scan()
         missing_signatures = []
-        for method, present in signature_checks.items():
-            if present:
+        for method, check in SIGNATURE_CHECKS.items():
+            if _evaluate(check, scan):
                 print(f"✅ {method} signature correct")
             else:
                 print(f"❌ {method} signature incorrect")
@@ -380,22 +376,9 @@ def test_task04_completeness():
     
     # Check implementation details from requirements
     try:
-        with open("src/services/recipe_detector.py", "r") as f:
-            content = f.read()
-        
-        implementation_details = {
-            "LangChain with Bedrock integration": "BedrockService" in content,
-            "Optimized prompts for recipe detection": "あなたは料理レシピの専門家です" in content,
-            "Structured output parsing": "json.loads" in content,
-            "Caching for repeated URLs": "_cache" in content and "3600" in content,
-            "Confidence thresholds and validation": "confidence_threshold" in content,
-            "Binary classification": "is_recipe" in content,
-            "Multi-language support": "_detect_japanese" in content,
-            "Fallback parsing for edge cases": "_fallback_parse_response" in content
-        }
-        
-        for detail, present in implementation_details.items():
-            if present:
+        scan = _scan()
+        for detail, check in IMPLEMENTATION_DETAILS.items():
+            if _evaluate(check, scan):
                 print(f"✅ {detail}")
             else:
                 print(f"❌ {detail}")
@@ -407,37 +390,33 @@ def test_task04_completeness():
     
     return all_complete
 
+# Report order for the command-line run: (name, zero-argument callable).
+TESTS = (
+    ("Implementation Requirements", test_implementation_requirements),
+    *((section[0], partial(run_checks, *section)) for section in CHECK_TABLE),
+    ("Method Signatures", test_method_signatures),
+    ("Task 04 Completeness", test_task04_completeness)
+)
+
 if __name__ == "__main__":
     print("🧪 Task 04 Basic Validation: Recipe Detection & Ingredient Extraction")
     print("=" * 70)
     
-    tests = [
-        ("Implementation Requirements", test_implementation_requirements),
-        ("AI Integration Features", test_ai_integration_features),
-        ("Multi-Language Support", test_multi_language_support),
-        ("Caching Implementation", test_caching_implementation),
-        ("Confidence & Validation", test_confidence_and_validation),
-        ("Structured Output", test_structured_output),
-        ("Error Handling", test_error_handling),
-        ("Observability Integration", test_observability_integration),
-        ("Method Signatures", test_method_signatures),
-        ("Task 04 Completeness", test_task04_completeness)
-    ]
+    # Every check reads the same file, so report a missing source once
+    # instead of letting each test fail on it separately.
+    if not Path(SOURCE_FILE).exists():
+        print(f"❌ source missing: {SOURCE_FILE}")
+        sys.exit(1)
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ {test_name} failed with error: {e}")
-            results.append(False)
+    # The checks only read the shared cached scan and AST, so they can run
+    # concurrently, one thread per CPU.
+    results = run_tests(TESTS, max_workers=os.cpu_count())
     
     print("\n" + "=" * 70)
     print("📊 SUMMARY")
     print("=" * 70)
     
-    for i, (test_name, _) in enumerate(tests):
+    for i, (test_name, _) in enumerate(TESTS):
         status = "✅ PASS" if results[i] else "❌ FAIL"
         print(f"{status} {test_name}")
     
@@ -459,7 +438,7 @@ if __name__ == "__main__":
         print("\nNote: Runtime testing requires AWS Bedrock access and configuration.")
         print("The implementation is structurally complete and ready for use.")
     else:
-        failed_tests = [tests[i][0] for i, result in enumerate(results) if not result]
+        failed_tests = [TESTS[i][0] for i, result in enumerate(results) if not result]
         print(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
     
     sys.exit(0 if all(results) else 1)
\ No newline at end of file
@@ -3,410 +3,323 @@
 
 import os
 import sys
-import ast
-import re
+from functools import lru_cache, partial
 
-def test_implementation_requirements():
-    """Test that the implementation meets Task 05 requirements."""
-    print("🧪 Testing Task 05 Implementation Requirements")
-    print("=" * 50)
-    
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        # Parse AST to analyze structure
-        tree = ast.parse(content)
-        
-        # Find RecipeAnalyzerApp class
-        app_class = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == "RecipeAnalyzerApp":
-                app_class = node
-                break
-        
-        if not app_class:
-            print("❌ RecipeAnalyzerApp class not found")
-            return False
-        
-        print("✅ RecipeAnalyzerApp class found")
-        
-        # Check for required methods
-        required_methods = [
-            'setup_page_config',
-            'initialize_session_state',
-            'initialize_services',
-            'render_header',
-            'render_sidebar',
-            'validate_url',
-            'validate_dish_name',
-            'add_message',
-            'display_chat_history',
-            'display_analysis_result',
-            'handle_url_input',
-            'handle_dish_input',
-            'render_main_interface',
-            'run'
-        ]
-        
-        found_methods = []
-        for node in app_class.body:
-            if isinstance(node, ast.FunctionDef):
-                found_methods.append(node.name)
-        
-        missing_methods = []
-        for method in required_methods:
-            if method in found_methods:
-                print(f"✅ {method} method implemented")
-            else:
-                print(f"❌ {method} method missing")
-                missing_methods.append(method)
-        
-        return len(missing_methods) == 0
-        
-    except Exception as e:
-        print(f"❌ Error analyzing implementation: {e}")
-        return False
+from validation_helpers import (
+    FAIL_FAST, AnyOf, AtLeast, cached_parse, emit, encode_literals,
+    find_literals, run_tests
+)
 
-def test_streamlit_integration():
-    """Test Streamlit framework integration."""
-    print("\n🧪 Testing Streamlit Integration")
-    print("=" * 35)
-    
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        streamlit_features = {
-            "Streamlit import": "import streamlit as st" in content,
-            "Page config": "st.set_page_config" in content,
-            "Page title": "page_title=" in content and "AI Recipe Analyzer" in content,
-            "Page icon": "page_icon=" in content,
-            "Layout configuration": "layout=" in content,
-            "Sidebar state": "initial_sidebar_state=" in content,
-            "Session state": "st.session_state" in content,
-            "Chat messages": "st.chat_message" in content,
-            "Forms": "st.form" in content,
-            "Spinner": "st.spinner" in content,
-            "Columns": "st.columns" in content,
-            "Expander": "st.expander" in content,
-            "Rerun functionality": "st.rerun" in content
-        }
-        
-        missing_features = []
-        for feature, present in streamlit_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking Streamlit integration: {e}")
-        return False
+SOURCE_FILE = "src/app.py"
 
-def test_chat_interface():
-    """Test chat interface implementation."""
-    print("\n🧪 Testing Chat Interface")
-    print("=" * 30)
-    
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        chat_features = {
-            "Message history": "messages" in content and "st.session_state.messages" in content,
-            "Add message function": "add_message" in content,
-            "Chat message display": "st.chat_message" in content,
-            "Role-based messaging": "role" in content and "content" in content,
-            "Timestamp tracking": "timestamp" in content and "datetime.now()" in content,
-            "Metadata support": "metadata" in content,
-            "Chat history display": "display_chat_history" in content,
-            "Welcome message": "Welcome!" in content,
-            "Message iteration": "for message in" in content,
-            "Clear history": "Clear History" in content,
-            "Session management": "session_state" in content
-        }
-        
-        missing_features = []
-        for feature, present in chat_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking chat interface: {e}")
-        return False
+@lru_cache(maxsize=1)
+def _load_app_source():
+    """Read the Streamlit app source once per run, as undecoded bytes."""
+    with open(SOURCE_FILE, "rb") as f:
+        return f.read()
 
-def test_input_handling():
-    """Test URL and dish name input handling."""
-    print("\n🧪 Testing Input Handling")
-    print("=" * 25)
-    
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        input_features = {
-            "URL input form": "url_form" in content,
-            "Dish input form": "dish_form" in content,
-            "URL validation": "validate_url" in content,
-            "Dish name validation": "validate_dish_name" in content,
-            "URL parsing": "urlparse" in content,
-            "Input sanitization": ".strip()" in content,
-            "Form submission": "form_submit_button" in content,
-            "Input placeholders": "placeholder=" in content,
-            "Help text": "help=" in content,
-            "Form clearing": "clear_on_submit=True" in content,
-            "Validation feedback": "Valid URL format" in content or "Valid dish name" in content,
-            "Error display": "st.error" in content
-        }
-        
-        missing_features = []
-        for feature, present in input_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking input handling: {e}")
-        return False
+@lru_cache(maxsize=1)
+def _parse_app_source():
+    """Parse the app source once; the tree is shared by the structural checks."""
+    return cached_parse(_load_app_source(), SOURCE_FILE)
 
-def test_results_display():
-    """Test results display formatting."""
-    print("\n🧪 Testing Results Display")
-    print("=" * 30)
-    
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        display_features = {
-            "Analysis result display": "display_analysis_result" in content,
-            "Recipe detection status": "Recipe detected" in content,
-            "Confidence display": "confidence:" in content,
-            "Ingredients display": "Ingredients" in content,
-            "Ingredient table": "st.dataframe" in content,
-            "Serving size display": "Serves:" in content,
-            "Copy ingredients": "Copy Ingredients" in content,
-            "Formatted copying": "format_ingredients_for_copy" in content,
-            "Analysis details": "Analysis Details" in content,
-            "Processing time": "Processing Time:" in content,
-            "Success indicators": "st.success" in content,
-            "Warning indicators": "st.warning" in content
-        }
-        
-        missing_features = []
-        for feature, present in display_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking results display: {e}")
-        return False
+# Each check is a needle string, a tuple of needles that must all be
+# present, an AnyOf, or an AtLeast.
+STREAMLIT_FEATURES = {
+    "Streamlit import": "import streamlit as st",
+    "Page config": "st.set_page_config",
+    "Page title": ("page_title=", "AI Recipe Analyzer"),
+    "Page icon": "page_icon=",
+    "Layout configuration": "layout=",
+    "Sidebar state": "initial_sidebar_state=",
+    "Session state": "st.session_state",
+    "Chat messages": "st.chat_message",
+    "Forms": "st.form",
+    "Spinner": "st.spinner",
+    "Columns": "st.columns",
+    "Expander": "st.expander",
+    "Rerun functionality": "st.rerun"
+}
+
+CHAT_FEATURES = {
+    "Message history": ("messages", "st.session_state.messages"),
+    "Add message function": "add_message",
+    "Chat message display": "st.chat_message",
+    "Role-based messaging": ("role", "content"),
+    "Timestamp tracking": ("timestamp", "datetime.now()"),
+    "Metadata support": "metadata",
+    "Chat history display": "display_chat_history",
+    "Welcome message": "Welcome!",
+    "Message iteration": "for message in",
+    "Clear history": "Clear History",
+    "Session management": "session_state"
+}
+
+INPUT_FEATURES = {
+    "URL input form": "url_form",
+    "Dish input form": "dish_form",
+    "URL validation": "validate_url",
+    "Dish name validation": "validate_dish_name",
+    "URL parsing": "urlparse",
+    "Input sanitization": ".strip()",
+    "Form submission": "form_submit_button",
+    "Input placeholders": "placeholder=",
+    "Help text": "help=",
+    "Form clearing": "clear_on_submit=True",
+    "Validation feedback": AnyOf(("Valid URL format", "Valid dish name")),
+    "Error display": "st.error"
+}
+
+DISPLAY_FEATURES = {
+    "Analysis result display": "display_analysis_result",
+    "Recipe detection status": "Recipe detected",
+    "Confidence display": "confidence:",
+    "Ingredients display": "Ingredients",
+    "Ingredient table": "st.dataframe",
+    "Serving size display": "Serves:",
+    "Copy ingredients": "Copy Ingredients",
+    "Formatted copying": "format_ingredients_for_copy",
+    "Analysis details": "Analysis Details",
+    "Processing time": "Processing Time:",
+    "Success indicators": "st.success",
+    "Warning indicators": "st.warning"
+}
+
+ERROR_FEATURES = {
+    "Exception handling": "except Exception as e:",
+    "Try-catch blocks": AtLeast("try:", 3),
+    "Error counting": "error_count",
+    "Error display": "st.error",
+    "Error details": "error_details",
+    "User-friendly messages": AnyOf(("Analysis failed", "Search failed")),
+    "Error logging": "str(e)",
+    "Service initialization errors": "Failed to initialize",
+    "Processing state management": "processing",
+    "Graceful degradation": "Some features may not be available",
+    "Configuration validation": "validate_aws_config"
+}
+
+SESSION_FEATURES = {
+    "Session state initialization": "initialize_session_state",
+    "Messages state": "st.session_state.messages",
+    "Processing state": "st.session_state.processing",
+    "Last analysis state": "st.session_state.last_analysis",
+    "Services state": "st.session_state.services_initialized",
+    "Error count state": "st.session_state.error_count",
+    "State persistence": "if \"messages\" not in st.session_state:",
+    "State clearing": "Clear History",
+    "State updates": "st.session_state",
+    "Session statistics": "Session Stats"
+}
+
+SERVICE_FEATURES = {
+    "BedrockService integration": "BedrockService",
+    "WebScraperService integration": "WebScraperService",
+    "RecipeDetectorService integration": "RecipeDetectorService",
+    "RAGService integration": "RAGService",
+    "Service initialization": "initialize_services",
+    "Recipe analysis": "analyze_recipe_url",
+    "Dish search": "search_dish_recipe",
+    "URL analysis method": "analyze_url",
+    "Recipe search method": "search_recipe",
+    "Service status display": "Service Status"
+}
 
-def test_error_handling():
-    """Test error handling and user feedback."""
-    print("\n🧪 Testing Error Handling")
-    print("=" * 25)
+OBSERVABILITY_FEATURES = {
+    "Observability imports": ("obs_manager", "trace_function"),
+    "Function tracing": "@trace_function",
+    "Metrics recording": "record_metric",
+    "Request tracking": "streamlit_analysis_request",
+    "Processing time metrics": "streamlit_processing_time",
+    "Success/failure tracking": ("\"success\": \"true\"", "\"success\": \"false\""),
+    "Operation classification": "\"type\":",
+    "Error categorization": "\"error\":",
+    "Observability status": "Observability active",
+    "Metrics context": ("\"url\"", "\"dish_search\"")
+}
+
+UI_FEATURES = {
+    "Application title": "AI Recipe Analyzer",
+    "Header rendering": "render_header",
+    "Sidebar rendering": "render_sidebar",
+    "Main interface": "render_main_interface",
+    "Help section": "render_help_section",
+    "Configuration display": "Configuration",
+    "Status indicators": ("st.success", "st.warning"),
+    "Columns layout": "st.columns",
+    "Dividers": "st.divider",
+    "Icons and emojis": ("🍳", "📄", "🔍"),
+    "Responsive design": "use_container_width=True",
+    "Help documentation": ("How to Use", "Troubleshooting")
+}
+
+IMPLEMENTATION_DETAILS = {
+    "Clean, user-friendly chat interface": ("chat_message", "Welcome!"),
+    "URL input validation and preview": ("validate_url", "Valid URL format"),
+    "Dish name input for RAG queries": ("dish_name", "search_recipe"),
+    "Real-time processing indicators": ("st.spinner", "Processing"),
+    "Session state for conversation history": "session_state.messages",
+    "Input validation and sanitization": ("validate_", ".strip()"),
+    "Loading spinners and progress": "st.spinner",
+    "Responsive design": ("layout=\"wide\"", "st.columns"),
+    "Error messages with details": "error_details",
+    "Configuration status display": "Service Status"
+}
+
+ALL_CHECKS = (
+    STREAMLIT_FEATURES, CHAT_FEATURES, INPUT_FEATURES, DISPLAY_FEATURES,
+    ERROR_FEATURES, SESSION_FEATURES, SERVICE_FEATURES,
+    OBSERVABILITY_FEATURES, UI_FEATURES, IMPLEMENTATION_DETAILS
+)
+
+# Every literal any section looks for, deduplicated across sections and
+# mapped to its UTF-8 encoding.
+ENCODED_LITERALS = encode_literals(
+    check for checks in ALL_CHECKS for check in checks.values()
+)
+
+@lru_cache(maxsize=1)
+def _found_literals():
+    """Return the subset of ENCODED_LITERALS present in the app source.
     
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        error_features = {
-            "Exception handling": "except Exception as e:" in content,
-            "Try-catch blocks": content.count("try:") >= 3,
-            "Error counting": "error_count" in content,
-            "Error display": "st.error" in content,
-            "Error details": "error_details" in content,
-            "User-friendly messages": "Analysis failed" in content or "Search failed" in content,
-            "Error logging": "str(e)" in content,
-            "Service initialization errors": "Failed to initialize" in content,
-            "Processing state management": "processing" in content,
-            "Graceful degradation": "Some features may not be available" in content,
-            "Configuration validation": "validate_aws_config" in content
-        }
-        
-        missing_features = []
-        for feature, present in error_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking error handling: {e}")
-        return False
+    Each literal is scanned once per run and every section then does set
+    lookups.
+    """
+    return find_literals(_load_app_source(), ENCODED_LITERALS)
+
+# Literals whose occurrence count matters, counted once alongside the scan.
+COUNTED_LITERALS = frozenset(
+    check.needle
+    for checks in ALL_CHECKS
+    for check in checks.values()
+    if isinstance(check, AtLeast)
+)
+
+@lru_cache(maxsize=1)
+def _literal_counts():
+    """Return the occurrence count of each literal in COUNTED_LITERALS."""
+    content = _load_app_source()
+    return {
+        needle: content.count(ENCODED_LITERALS[needle]) for needle in COUNTED_LITERALS
+    }
 
-def test_session_state_management():
-    """Test session state management."""
-    print("\n🧪 Testing Session State Management")
-    print("=" * 40)
+def _present(check, found):
+    """Evaluate a check against the set of literals found in the source.
     
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        session_features = {
-            "Session state initialization": "initialize_session_state" in content,
-            "Messages state": "st.session_state.messages" in content,
-            "Processing state": "st.session_state.processing" in content,
-            "Last analysis state": "st.session_state.last_analysis" in content,
-            "Services state": "st.session_state.services_initialized" in content,
-            "Error count state": "st.session_state.error_count" in content,
-            "State persistence": "if \"messages\" not in st.session_state:" in content,
-            "State clearing": "Clear History" in content,
-            "State updates": "st.session_state" in content,
-            "Session statistics": "Session Stats" in content
-        }
-        
-        missing_features = []
-        for feature, present in session_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking session state: {e}")
-        return False
+    Compound checks use frozenset operations so the needles are tested in
+    C rather than through a Python-level generator.
+    """
+    if isinstance(check, str):
+        return check in found
+    if isinstance(check, AnyOf):
+        return not found.isdisjoint(check.needles)
+    if isinstance(check, AtLeast):
+        return _literal_counts()[check.needle] >= check.count
+    return found.issuperset(check)
+
+# Methods RecipeAnalyzerApp must define, in report order.
+REQUIRED_METHODS = (
+    'setup_page_config',
+    'initialize_session_state',
+    'initialize_services',
+    'render_header',
+    'render_sidebar',
+    'validate_url',
+    'validate_dish_name',
+    'add_message',
+    'display_chat_history',
+    'display_analysis_result',
+    'handle_url_input',
+    'handle_dish_input',
+    'render_main_interface',
+    'run'
+)
 
-def test_service_integration():
-    """Test AI service integration."""
-    print("\n🧪 Testing Service Integration")
-    print("=" * 35)
+def test_implementation_requirements():
+    """Test that the implementation meets Task 05 requirements."""
+    out = ["🧪 Testing Task 05 Implementation Requirements", "=" * 50]
+    
+    import ast  # Only the structural check needs it
     
     try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        service_features = {
-            "BedrockService integration": "BedrockService" in content,
-            "WebScraperService integration": "WebScraperService" in content,
-            "RecipeDetectorService integration": "RecipeDetectorService" in content,
-            "RAGService integration": "RAGService" in content,
-            "Service initialization": "initialize_services" in content,
-            "Recipe analysis": "analyze_recipe_url" in content,
-            "Dish search": "search_dish_recipe" in content,
-            "URL analysis method": "analyze_url" in content,
-            "Recipe search method": "search_recipe" in content,
-            "Service status display": "Service Status" in content
-        }
+        # Parse AST to analyze structure
+        tree = _parse_app_source()
         
-        missing_features = []
-        for feature, present in service_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
+        # Find RecipeAnalyzerApp class; it is defined at module level
+        app_class = next(
+            (node for node in tree.body
+             if isinstance(node, ast.ClassDef) and node.name == "RecipeAnalyzerApp"),
+            None
+        )
         
-        return len(missing_features) == 0
+        if not app_class:
+            out.append("❌ RecipeAnalyzerApp class not found")
+            return False
         
-    except Exception as e:
-        print(f"❌ Error checking service integration: {e}")
-        return False
-
-def test_observability_integration():
-    """Test observability integration."""
-    print("\n🧪 Testing Observability Integration")
-    print("=" * 40)
-    
-    try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
+        out.append("✅ RecipeAnalyzerApp class found")
         
-        observability_features = {
-            "Observability imports": "obs_manager" in content and "trace_function" in content,
-            "Function tracing": "@trace_function" in content,
-            "Metrics recording": "record_metric" in content,
-            "Request tracking": "streamlit_analysis_request" in content,
-            "Processing time metrics": "streamlit_processing_time" in content,
-            "Success/failure tracking": "\"success\": \"true\"" in content and "\"success\": \"false\"" in content,
-            "Operation classification": "\"type\":" in content,
-            "Error categorization": "\"error\":" in content,
-            "Observability status": "Observability active" in content,
-            "Metrics context": "\"url\"" in content and "\"dish_search\"" in content
+        found_methods = {
+            node.name for node in app_class.body if isinstance(node, ast.FunctionDef)
         }
         
-        missing_features = []
-        for feature, present in observability_features.items():
-            if present:
-                print(f"✅ {feature}")
+        for method in REQUIRED_METHODS:
+            if method in found_methods:
+                out.append(f"✅ {method} method implemented")
             else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
+                out.append(f"❌ {method} method missing")
         
-        return len(missing_features) == 0
+        return found_methods.issuperset(REQUIRED_METHODS)
         
     except Exception as e:
-        print(f"❌ Error checking observability: {e}")
+        out.append(f"❌ Error analyzing implementation: {e}")
         return False
+    finally:
+        emit(out)
 
-def test_user_interface_components():
-    """Test UI components and layout."""
-    print("\n🧪 Testing UI Components")
-    print("=" * 25)
+def run_checks(name, width, checks, error_label):
+    """Report each feature check in ``checks`` under a section header."""
+    out = [f"\n🧪 Testing {name}", "=" * width]
     
     try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
-        
-        ui_features = {
-            "Application title": "AI Recipe Analyzer" in content,
-            "Header rendering": "render_header" in content,
-            "Sidebar rendering": "render_sidebar" in content,
-            "Main interface": "render_main_interface" in content,
-            "Help section": "render_help_section" in content,
-            "Configuration display": "Configuration" in content,
-            "Status indicators": "st.success" in content and "st.warning" in content,
-            "Columns layout": "st.columns" in content,
-            "Dividers": "st.divider" in content,
-            "Icons and emojis": "🍳" in content and "📄" in content and "🔍" in content,
-            "Responsive design": "use_container_width=True" in content,
-            "Help documentation": "How to Use" in content and "Troubleshooting" in content
-        }
+        found = _found_literals()
         
         missing_features = []
-        for feature, present in ui_features.items():
-            if present:
-                print(f"✅ {feature}")
+        for feature, check in checks.items():
+            if _present(check, found):
+                out.append(f"✅ {feature}")
             else:
-                print(f"❌ {feature}")
+                out.append(f"❌ {feature}")
                 missing_features.append(feature)
         
         return len(missing_features) == 0
         
     except Exception as e:
-        print(f"❌ Error checking UI components: {e}")
+        out.append(f"❌ Error checking {error_label}: {e}")
         return False
+    finally:
+        emit(out)
+
+# Feature sections in report order: (name, underline width, checks, error label).
+CHECK_TABLE = (
+    ("Streamlit Integration", 35, STREAMLIT_FEATURES, "Streamlit integration"),
+    ("Chat Interface", 30, CHAT_FEATURES, "chat interface"),
+    ("Input Handling", 25, INPUT_FEATURES, "input handling"),
+    ("Results Display", 30, DISPLAY_FEATURES, "results display"),
+    ("Error Handling", 25, ERROR_FEATURES, "error handling"),
+    ("Session State Management", 40, SESSION_FEATURES, "session state"),
+    ("Service Integration", 35, SERVICE_FEATURES, "service integration"),
+    ("Observability Integration", 40, OBSERVABILITY_FEATURES, "observability"),
+    ("UI Components", 25, UI_FEATURES, "UI components")
+)
+
+def test_feature_checks():
+    """Run every section of CHECK_TABLE."""
+    results = [run_checks(*section) for section in CHECK_TABLE]
+    return all(results)
 
 def test_task05_completeness():
     """Overall completeness check for Task 05."""
-    print("\n🧪 Testing Task 05 Completeness")
-    print("=" * 35)
+    out = ["\n🧪 Testing Task 05 Completeness", "=" * 35]
     
     deliverables = {
         "Main app.py Streamlit application": True,  # Checked above
@@ -420,99 +333,105 @@ def test_task05_completeness():
     all_complete = True
     for deliverable, status in deliverables.items():
         if status:
-            print(f"✅ {deliverable}")
+            out.append(f"✅ {deliverable}")
         else:
-            print(f"❌ {deliverable}")
+            out.append(f"❌ {deliverable}")
             all_complete = False
     
     # Check implementation details from requirements
     try:
-        with open("src/app.py", "r") as f:
-            content = f.read()
+        found = _found_literals()
         
-        implementation_details = {
-            "Clean, user-friendly chat interface": "chat_message" in content and "Welcome!" in content,
-            "URL input validation and preview": "validate_url" in content and "Valid URL format" in content,
-            "Dish name input for RAG queries": "dish_name" in content and "search_recipe" in content,
-            "Real-time processing indicators": "st.spinner" in content and "Processing" in content,
-            "Session state for conversation history": "session_state.messages" in content,
-            "Input validation and sanitization": "validate_" in content and ".strip()" in content,
-            "Loading spinners and progress": "st.spinner" in content,
-            "Responsive design": "layout=\"wide\"" in content and "st.columns" in content,
-            "Error messages with details": "error_details" in content,
-            "Configuration status display": "Service Status" in content
-        }
-        
-        for detail, present in implementation_details.items():
-            if present:
-                print(f"✅ {detail}")
+        for detail, check in IMPLEMENTATION_DETAILS.items():
+            if _present(check, found):
+                out.append(f"✅ {detail}")
             else:
-                print(f"❌ {detail}")
+                out.append(f"❌ {detail}")
                 all_complete = False
                 
     except Exception as e:
-        print(f"⚠️  Could not check implementation details: {e}")
+        out.append(f"⚠️  Could not check implementation details: {e}")
         all_complete = False
     
+    emit(out)
     return all_complete
 
+def _run_until_failure(tests):
+    """Run the tests in order, stopping at the first failure.
+    
+    Tests after the failure are not run and are reported as ``None``.
+    """
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+        except Exception as e:
+            print(f"❌ {test_name} failed with error: {e}")
+            result = False
+        results.append(result)
+        if not result:
+            break
+    return results + [None] * (len(tests) - len(results))
+
 if __name__ == "__main__":
     print("🧪 Task 05 Basic Validation: Streamlit Web Interface")
     print("=" * 60)
     
     tests = [
         ("Implementation Requirements", test_implementation_requirements),
-        ("Streamlit Integration", test_streamlit_integration),
-        ("Chat Interface", test_chat_interface),
-        ("Input Handling", test_input_handling),
-        ("Results Display", test_results_display),
-        ("Error Handling", test_error_handling),
-        ("Session State Management", test_session_state_management),
-        ("Service Integration", test_service_integration),
-        ("Observability Integration", test_observability_integration),
-        ("UI Components", test_user_interface_components),
+        *((section[0], partial(run_checks, *section)) for section in CHECK_TABLE),
         ("Task 05 Completeness", test_task05_completeness)
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ {test_name} failed with error: {e}")
-            results.append(False)
-    
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    # Under FAIL_FAST stop at the first failing test (useful in CI); the
+    # tests then run serially.
+    if FAIL_FAST:
+        results = _run_until_failure(tests)
+    else:
+        results = run_tests(tests, max_workers=os.cpu_count())
     
-    for i, (test_name, _) in enumerate(tests):
-        status = "✅ PASS" if results[i] else "❌ FAIL"
-        print(f"{status} {test_name}")
+    # Build the summary as one block so it goes out in a single write.
+    lines = ["", "=" * 60, "📊 SUMMARY", "=" * 60]
+    status = {True: "✅ PASS", False: "❌ FAIL", None: "⏭️  SKIP"}
+    passed = 0
+    failed_tests = []
+    for (test_name, _), result in zip(tests, results):
+        lines.append(f"{status[result]} {test_name}")
+        if result:
+            passed += 1
+        elif result is False:
+            failed_tests.append(test_name)
+    all_passed = passed == len(results)
     
-    success_rate = sum(results) / len(results) * 100
-    print(f"\nOverall: {success_rate:.0f}% tests passed")
+    # Float division keeps the rounding the report has always printed.
+    success_rate = passed / len(results) * 100
+    lines.append(f"\nOverall: {success_rate:.0f}% tests passed")
     
-    if all(results):
-        print("\n🎉 Task 05 implementation is complete!")
-        print("✅ Streamlit Web Interface fully implemented with all requirements:")
-        print("   • Clean, modern chat-style interface with message history")
-        print("   • Dual input methods: Recipe URL analysis and dish name search")
-        print("   • Real-time input validation with user-friendly feedback")
-        print("   • Beautiful results display with structured ingredient tables")
-        print("   • Comprehensive error handling with detailed error messages")
-        print("   • Session state management for conversation persistence")
-        print("   • Responsive design with sidebar configuration panel")
-        print("   • Service integration with BedrockService, WebScraperService, etc.")
-        print("   • OpenTelemetry observability integration with detailed metrics")
-        print("   • Built-in help documentation and troubleshooting guides")
-        print("   • Copy-to-clipboard functionality for ingredient lists")
-        print("   • Processing indicators and status feedback")
-        print("\nNote: Runtime testing requires Streamlit and service dependencies.")
-        print("The implementation is structurally complete and ready for use.")
+    if all_passed:
+        lines.extend([
+            "\n🎉 Task 05 implementation is complete!",
+            "✅ Streamlit Web Interface fully implemented with all requirements:",
+            "   • Clean, modern chat-style interface with message history",
+            "   • Dual input methods: Recipe URL analysis and dish name search",
+            "   • Real-time input validation with user-friendly feedback",
+            "   • Beautiful results display with structured ingredient tables",
+            "   • Comprehensive error handling with detailed error messages",
+            "   • Session state management for conversation persistence",
+            "   • Responsive design with sidebar configuration panel",
+            "   • Service integration with BedrockService, WebScraperService, etc.",
+            "   • OpenTelemetry observability integration with detailed metrics",
+            "   • Built-in help documentation and troubleshooting guides",
+            "   • Copy-to-clipboard functionality for ingredient lists",
+            "   • Processing indicators and status feedback",
+            "\nNote: Runtime testing requires Streamlit and service dependencies.",
+            "The implementation is structurally complete and ready for use."
+        ])
     else:
-        failed_tests = [tests[i][0] for i, result in enumerate(results) if not result]
-        print(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
+        lines.append(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
+        skipped = len(results) - passed - len(failed_tests)
+        if skipped:
+            lines.append(f"⏭️  Skipped {skipped} test(s) after the first failure (fail-fast)")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    sys.exit(0 if all(results) else 1)
\ No newline at end of file
+    sys.exit(0 if all_passed else 1)
\ No newline at end of file
@@ -1,455 +1,550 @@
 #!/usr/bin/env python3
 """Basic validation test for Task 06 without requiring external libraries."""
 
+import hashlib
+import json
+import mmap
 import os
 import sys
 import ast
 import re
+from functools import lru_cache
+from typing import NamedTuple
 
-def test_implementation_requirements():
-    """Test that the implementation meets Task 06 requirements."""
-    print("🧪 Testing Task 06 Implementation Requirements")
-    print("=" * 50)
+from validation_helpers import (
+    FAIL_FAST, HELPERS_FILE, AnyOf, cached_parse, emit, encode_literals,
+    find_literals, results_cache_path, run_tests, write_cache_file
+)
+
+SOURCE_FILE = "src/services/rag_service.py"
+
+@lru_cache(maxsize=1)
+def _load_source():
+    """Map the RAG service source read-only, once per run.
     
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        # Parse AST to analyze structure
-        tree = ast.parse(content)
-        
-        # Find RAGService class
-        rag_class = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == "RAGService":
-                rag_class = node
+    The mapping is shared by every check (and thread) without copying the
+    file into a bytes object. Use ``.find()`` on it: ``in`` on an mmap
+    only tests single bytes, not substrings.
+    """
+    with open(SOURCE_FILE, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""  # mmap can't map an empty file
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class ImportsFrom(NamedTuple):
+    """Check that passes when the source does ``from module import name``."""
+    module: str
+    name: str
+
+class Decorator(NamedTuple):
+    """Check that passes when some function is decorated with ``name``."""
+    name: str
+
+class Signature(NamedTuple):
+    """Check that passes when a function with this signature is defined.
+    
+    ``text`` is written as source (``def f(self) -> bool:``) and compared
+    in ast.unparse form, so spacing and quote style don't matter.
+    """
+    text: str
+
+class Structure(NamedTuple):
+    """Check that passes when the named group of STRUCTURE_RE matches."""
+    name: str
+
+# Statement-shaped patterns that a bare substring can't pin down, matched
+# by one multiline pass over the source; each alternative is a named group.
+STRUCTURE_RE = re.compile(
+    rb"^[ \t]*(?P<langchain_guard>if LANGCHAIN_AVAILABLE:)"
+    rb"|(?P<qa_chain_factory>\bRetrievalQA\.from_chain_type\()",
+    re.MULTILINE
+)
+
+# Each table is a tuple of (label, check) pairs in report order. A check
+# is a needle string, a tuple of needles that must all be present, an
+# AnyOf, or one of the structural ImportsFrom, Decorator, Signature and
+# Structure.
+LANGCHAIN_FEATURES = (
+    ("LangChain imports", "from langchain"),
+    ("AmazonKnowledgeBasesRetriever", "AmazonKnowledgeBasesRetriever"),
+    ("RetrievalQA chain", "RetrievalQA"),
+    ("PromptTemplate", "PromptTemplate"),
+    ("Bedrock LLM", ImportsFrom("langchain.llms.bedrock", "Bedrock")),
+    ("Document schema", ImportsFrom("langchain.schema", "Document")),
+    ("Error handling for imports", "LANGCHAIN_AVAILABLE"),
+    ("Conditional initialization", Structure("langchain_guard")),
+    ("Chain creation", Structure("qa_chain_factory")),
+    ("Retriever configuration", "retrieval_config")
+)
+
+KB_FEATURES = (
+    ("Knowledge Base ID config", "KNOWLEDGE_BASE_ID"),
+    ("S3 bucket integration", "S3_BUCKET_NAME"),
+    ("Vector search configuration", "vectorSearchConfiguration"),
+    ("Hybrid search type", "HYBRID"),
+    ("Number of results", "numberOfResults"),
+    ("Region configuration", "region_name"),
+    ("Retrieval optimization", "retrieval_config"),
+    ("Document retrieval", "get_relevant_documents"),
+    ("Source documents", "source_documents"),
+    ("Knowledge Base connection test", "test_connection")
+)
+
+PROMPT_FEATURES = (
+    ("Recipe prompt template", "recipe_prompt_template"),
+    ("Input variables", "input_variables"),
+    ("Japanese prompts", "あなたは料理の専門家です"),
+    ("Context placeholder", "{context}"),
+    ("Question placeholder", "{question}"),
+    ("Structured output format", ("レシピ名", "材料リスト")),
+    ("Recipe format specification", ("調理手順", "調理時間")),
+    ("Fallback suggestions", "代替レシピ"),
+    ("Template conditional creation", "if LANGCHAIN_AVAILABLE else None"),
+    ("Chain prompt integration", "chain_type_kwargs")
+)
+
+SEARCH_FEATURES = (
+    ("Search recipe method", "def search_recipe"),
+    ("Dish name formatting", "_format_dish_query"),
+    ("Multi-language queries", ("のレシピ", "recipe")),
+    ("QA chain execution", "self.qa_chain"),
+    ("Recipe info extraction", "_extract_recipe_info"),
+    ("Answer validation", "_validate_retrieval_result"),
+    ("Confidence scoring", "confidence_score"),
+    ("Source limitation", "[:3]"),  # Limit to top 3 sources
+    ("Processing time tracking", "processing_time"),
+    ("Fallback error handling", "申し訳ございませんが"),
+    ("Language parameter", "language: str = \"auto\""),
+    ("Recipe found detection", "recipe_found")
+)
+
+OUTPUT_FEATURES = (
+    ("Recipe found flag", "\"recipe_found\":"),
+    ("Recipe name field", "\"recipe_name\":"),
+    ("Answer field", "\"answer\":"),
+    ("Ingredients list", "\"ingredients\":"),
+    ("Instructions list", "\"instructions\":"),
+    ("Confidence field", "\"confidence\":"),
+    ("Sources array", "\"sources\":"),
+    ("Processing time", "\"processing_time\":"),
+    ("Timestamp", "\"timestamp\":"),
+    ("Language field", "\"language\":"),
+    ("Error field", "\"error\":"),
+    ("Query used field", "\"query_used\":"),
+    ("Source metadata", "doc.metadata"),
+    ("Content truncation", "[:200]")  # Content limiting
+)
+
+ERROR_FEATURES = (
+    ("Service availability check", "if not self.is_available():"),
+    ("LangChain import error handling", "except ImportError"),
+    ("Initialization error handling", "except Exception as e:"),
+    ("Search error handling", ("try:", "except Exception as e:")),
+    ("Configuration validation", "required_settings"),
+    ("Graceful degradation", "Service not available"),
+    ("User-friendly error messages", "申し訳ございませんが"),
+    ("Error logging", "logger.error"),
+    ("Component initialization check", "self._is_initialized"),
+    ("Fallback responses", "recipe_found\": False")
+)
+
+OBSERVABILITY_FEATURES = (
+    ("trace_function decorator", Decorator("trace_function")),
+    ("Observability imports", "obs_manager"),
+    ("Metrics recording", "record_metric"),
+    ("Search metrics", "rag_service_search"),
+    ("Processing time metrics", "rag_service_processing_time"),
+    ("Success/failure tracking", ("\"success\": \"true\"", "\"success\": \"false\"")),
+    ("Confidence bucketing", "_get_confidence_bucket"),
+    ("Operation classification", "\"operation\":"),
+    ("Error categorization", "\"error\":"),
+    ("Recipe found tracking", "\"recipe_found\":"),
+    ("Language tracking", "\"language\":"),
+    ("Processing time measurement", "time.time() - start_time")
+)
+
+ADDITIONAL_FEATURES = (
+    ("Service info method", "get_service_info"),
+    ("Recipe listing", "list_available_recipes"),
+    ("Similar recipe suggestions", "suggest_similar_recipes"),
+    ("Connection testing", "test_connection"),
+    ("Multi-language support", "supported_languages"),
+    ("Confidence buckets", ("high", "medium", "low")),
+    ("S3 integration awareness", "S3_BUCKET_NAME"),
+    ("PDF format support", AnyOf(("Dish Name].pdf", "PDF"))),
+    ("Hybrid search configuration", "HYBRID"),
+    ("Document limiting", ("[:3]", "[:10]"))  # Source and ingredient limits
+)
+
+# Key method signatures.
+SIGNATURE_CHECKS = (
+    ("search_recipe", Signature("def search_recipe(self, dish_name: str, language: str = \"auto\") -> Dict[str, Any]:")),
+    ("is_available", Signature("def is_available(self) -> bool:")),
+    ("test_connection", Signature("def test_connection(self) -> Dict[str, Any]:")),
+    ("get_service_info", Signature("def get_service_info(self) -> Dict[str, Any]:")),
+    ("_format_dish_query", Signature("def _format_dish_query(self, dish_name: str) -> str:")),
+    ("_extract_recipe_info", Signature("def _extract_recipe_info(self, documents: List[Document]) -> Dict[str, Any]:"))
+)
+
+IMPLEMENTATION_DETAILS = (
+    ("LangChain with BedrockKnowledgeBasesRetriever", "AmazonKnowledgeBasesRetriever"),
+    ("LangChain RetrievalQA chain integration", Structure("qa_chain_factory")),
+    ("Vector similarity search through LangChain", "vectorSearchConfiguration"),
+    ("Document chunking and retrieval optimization", "numberOfResults"),
+    ("Confidence scoring for retrieved documents", "confidence_score"),
+    ("PDF recipe format support", AnyOf(("[Dish Name].pdf", "PDF"))),
+    ("LangChain Bedrock LLM integration", ImportsFrom("langchain.llms.bedrock", "Bedrock")),
+    ("Recipe-specific prompt templates", "あなたは料理の専門家です"),
+    ("Multi-language query handling", ("のレシピ", "recipe")),
+    ("Comprehensive error handling", ("is_available", "LANGCHAIN_AVAILABLE"))
+)
+
+ALL_CHECKS = (
+    LANGCHAIN_FEATURES, KB_FEATURES, PROMPT_FEATURES, SEARCH_FEATURES,
+    OUTPUT_FEATURES, ERROR_FEATURES, OBSERVABILITY_FEATURES,
+    ADDITIONAL_FEATURES, SIGNATURE_CHECKS, IMPLEMENTATION_DETAILS
+)
+
+# Every literal any section looks for, deduplicated across sections and
+# mapped to its UTF-8 encoding.
+ENCODED_LITERALS = encode_literals(
+    check for checks in ALL_CHECKS for _, check in checks
+)
+
+@lru_cache(maxsize=1)
+def _found_literals():
+    """Return the subset of ENCODED_LITERALS present in the RAG service source.
+    
+    Each literal is scanned once per run and every section then does set
+    lookups.
+    """
+    return find_literals(_load_source(), ENCODED_LITERALS)
+
+class SourceInfo(NamedTuple):
+    """Structural facts collected from one walk over the source AST.
+    
+    ``classes`` maps class names to ClassDef nodes, ``methods`` maps class
+    names to their method names, ``imports`` holds a ``(module, name)``
+    pair for every imported name (relative modules keep their leading
+    dots; a plain ``import module`` records name None), ``decorators`` maps
+    function names to the names of their decorators and ``signatures``
+    holds the canonical signature of every function.
+    """
+    classes: dict
+    methods: dict
+    imports: frozenset
+    decorators: dict
+    signatures: frozenset
+
+def _canonical_signature(node):
+    """Render a function's signature in normalized ast.unparse form."""
+    keyword = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+    return f"{keyword} {node.name}({ast.unparse(node.args)}){returns}"
+
+@lru_cache(maxsize=None)
+def _expected_signature(text):
+    """Normalize a signature written as source, e.g. ``def f(self) -> bool:``."""
+    return _canonical_signature(ast.parse(f"{text} ...").body[0])
+
+def _decorator_name(node):
+    """Return the name a decorator refers to, e.g. ``trace_function``."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+def _analyze(tree):
+    """Collect classes, methods, imports and decorators in a single ast.walk.
+    
+    Nodes are dispatched on their exact type through a dict, which is one
+    hash lookup per node instead of a chain of isinstance checks.
+    """
+    classes, methods, decorators = {}, {}, {}
+    imports, signatures = set(), set()
+    function_defs = (ast.FunctionDef, ast.AsyncFunctionDef)
+    
+    def on_class(node):
+        classes[node.name] = node
+        methods[node.name] = {
+            child.name for child in node.body if type(child) in function_defs
+        }
+    
+    def on_function(node):
+        decorators.setdefault(node.name, set()).update(
+            _decorator_name(d) for d in node.decorator_list
+        )
+        signature = _canonical_signature(node)
+        signatures.add(signature)
+        # A ``def f(...)`` check also matches ``async def f(...)``, as the
+        # substring check it replaced did
+        signatures.add(signature.removeprefix("async "))
+    
+    def on_import(node):
+        imports.update((alias.name, None) for alias in node.names)
+    
+    def on_import_from(node):
+        module = "." * node.level + (node.module or "")
+        imports.update((module, alias.name) for alias in node.names)
+    
+    handlers = {
+        ast.ClassDef: on_class,
+        ast.FunctionDef: on_function,
+        ast.AsyncFunctionDef: on_function,
+        ast.Import: on_import,
+        ast.ImportFrom: on_import_from
+    }
+    for node in ast.walk(tree):
+        handler = handlers.get(type(node))
+        if handler is not None:
+            handler(node)
+    return SourceInfo(
+        classes, methods, frozenset(imports), decorators, frozenset(signatures)
+    )
+
+@lru_cache(maxsize=1)
+def _source_info():
+    """Analyze the (cached) AST of the RAG service source once per run."""
+    return _analyze(cached_parse(_load_source(), SOURCE_FILE))
+
+@lru_cache(maxsize=1)
+def _structure_hits():
+    """Return the names of the STRUCTURE_RE groups that match the source."""
+    return frozenset(m.lastgroup for m in STRUCTURE_RE.finditer(_load_source()))
+
+def _present(check, found):
+    """Evaluate a check against the set of literals found in the source.
+    
+    Compound literal checks use frozenset operations, so they are pure
+    set lookups against the shared scan with no Python-level loop.
+    """
+    if isinstance(check, str):
+        return check in found
+    if isinstance(check, AnyOf):
+        return not found.isdisjoint(check.needles)
+    if isinstance(check, ImportsFrom):
+        return (check.module, check.name) in _source_info().imports
+    if isinstance(check, Decorator):
+        decorators = _source_info().decorators
+        return any(check.name in names for names in decorators.values())
+    if isinstance(check, Structure):
+        return check.name in _structure_hits()
+    if isinstance(check, Signature):
+        return _expected_signature(check.text) in _source_info().signatures
+    return found.issuperset(check)
+
+@lru_cache(maxsize=None, typed=True)
+def _evaluate(check):
+    """Evaluate ``check`` once per run; repeats reuse the earlier result.
+    
+    Several completeness details are the same checks an earlier section
+    already ran, so they cost a dict lookup instead of a re-evaluation.
+    The cache is typed because the check NamedTuples compare equal to each
+    other (and to plain tuples) when their fields match.
+    """
+    return _present(check, _found_literals())
+
+def _missing_mask(checks):
+    """Return a bitmask with bit ``i`` set when the i-th check in ``checks`` fails.
+    
+    Under FAIL_FAST each section stops at its first failing check: only
+    the lowest failing bit is set and later checks are not evaluated.
+    """
+    missing = 0
+    for i, (_, check) in enumerate(checks):
+        if not _evaluate(check):
+            missing |= 1 << i
+            if FAIL_FAST:
                 break
-        
-        if not rag_class:
-            print("❌ RAGService class not found")
-            return False
-        
-        print("✅ RAGService class found")
-        
-        # Check for required methods
-        required_methods = [
-            '__init__',
-            'is_available',
-            'search_recipe',
-            'test_connection',
-            'get_service_info',
-            '_initialize_rag_components',
-            '_format_dish_query',
-            '_extract_recipe_info',
-            '_validate_retrieval_result',
-            '_get_confidence_bucket'
-        ]
-        
-        found_methods = []
-        for node in rag_class.body:
-            if isinstance(node, ast.FunctionDef):
-                found_methods.append(node.name)
-        
-        missing_methods = []
-        for method in required_methods:
-            if method in found_methods:
-                print(f"✅ {method} method implemented")
-            else:
-                print(f"❌ {method} method missing")
-                missing_methods.append(method)
-        
-        return len(missing_methods) == 0
-        
-    except Exception as e:
-        print(f"❌ Error analyzing implementation: {e}")
-        return False
+    return missing
 
-def test_langchain_integration():
-    """Test LangChain integration features."""
-    print("\n🧪 Testing LangChain Integration")
-    print("=" * 35)
+# Methods RAGService must define, in report order.
+REQUIRED_METHODS = (
+    '__init__',
+    'is_available',
+    'search_recipe',
+    'test_connection',
+    'get_service_info',
+    '_initialize_rag_components',
+    '_format_dish_query',
+    '_extract_recipe_info',
+    '_validate_retrieval_result',
+    '_get_confidence_bucket'
+)
+
+def run_checks(name, width, checks, error_label, passed="{}", failed="{}"):
+    """Report each (label, check) pair in ``checks`` under a section header.
+    
+    ``passed`` and ``failed`` format the label for its report line. Returns
+    True when every check passes.
+    """
+    out = [f"\n🧪 Testing {name}", "=" * width]
     
     try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        langchain_features = {
-            "LangChain imports": "from langchain" in content,
-            "AmazonKnowledgeBasesRetriever": "AmazonKnowledgeBasesRetriever" in content,
-            "RetrievalQA chain": "RetrievalQA" in content,
-            "PromptTemplate": "PromptTemplate" in content,
-            "Bedrock LLM": "from langchain.llms.bedrock import Bedrock" in content,
-            "Document schema": "from langchain.schema import Document" in content,
-            "Error handling for imports": "LANGCHAIN_AVAILABLE" in content,
-            "Conditional initialization": "if LANGCHAIN_AVAILABLE:" in content,
-            "Chain creation": "RetrievalQA.from_chain_type" in content,
-            "Retriever configuration": "retrieval_config" in content
-        }
-        
-        missing_features = []
-        for feature, present in langchain_features.items():
-            if present:
-                print(f"✅ {feature}")
+        missing = _missing_mask(checks)
+        for i, (label, _) in enumerate(checks):
+            if missing >> i & 1:
+                out.append("❌ " + failed.format(label))
+                if FAIL_FAST:
+                    break
             else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
+                out.append("✅ " + passed.format(label))
         
-        return len(missing_features) == 0
+        return missing == 0
         
     except Exception as e:
-        print(f"❌ Error checking LangChain integration: {e}")
+        out.append(f"❌ Error checking {error_label}: {e}")
         return False
+    finally:
+        emit(out)
 
-def test_knowledge_base_features():
-    """Test Knowledge Base specific features."""
-    print("\n🧪 Testing Knowledge Base Features")
-    print("=" * 40)
+def test_implementation_requirements():
+    """Test that the implementation meets Task 06 requirements."""
+    out = ["🧪 Testing Task 06 Implementation Requirements", "=" * 50]
     
     try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
+        # Look up RAGService in the shared AST analysis
+        rag_methods = _source_info().methods.get("RAGService")
         
-        kb_features = {
-            "Knowledge Base ID config": "KNOWLEDGE_BASE_ID" in content,
-            "S3 bucket integration": "S3_BUCKET_NAME" in content,
-            "Vector search configuration": "vectorSearchConfiguration" in content,
-            "Hybrid search type": "HYBRID" in content,
-            "Number of results": "numberOfResults" in content,
-            "Region configuration": "region_name" in content,
-            "Retrieval optimization": "retrieval_config" in content,
-            "Document retrieval": "get_relevant_documents" in content,
-            "Source documents": "source_documents" in content,
-            "Knowledge Base connection test": "test_connection" in content
-        }
+        if rag_methods is None:
+            out.append("❌ RAGService class not found")
+            return False
+        
+        out.append("✅ RAGService class found")
         
-        missing_features = []
-        for feature, present in kb_features.items():
-            if present:
-                print(f"✅ {feature}")
+        for method in REQUIRED_METHODS:
+            if method in rag_methods:
+                out.append(f"✅ {method} method implemented")
             else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
+                out.append(f"❌ {method} method missing")
+                if FAIL_FAST:
+                    break
         
-        return len(missing_features) == 0
+        return rag_methods.issuperset(REQUIRED_METHODS)
         
     except Exception as e:
-        print(f"❌ Error checking Knowledge Base features: {e}")
+        out.append(f"❌ Error analyzing implementation: {e}")
         return False
+    finally:
+        emit(out)
+
+def test_langchain_integration():
+    """Test LangChain integration features."""
+    return run_checks("LangChain Integration", 35, LANGCHAIN_FEATURES, "LangChain integration")
+
+def test_knowledge_base_features():
+    """Test Knowledge Base specific features."""
+    return run_checks("Knowledge Base Features", 40, KB_FEATURES, "Knowledge Base features")
 
 def test_prompt_templates():
     """Test prompt template implementation."""
-    print("\n🧪 Testing Prompt Templates")
-    print("=" * 30)
-    
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        prompt_features = {
-            "Recipe prompt template": "recipe_prompt_template" in content,
-            "Input variables": "input_variables" in content,
-            "Japanese prompts": "あなたは料理の専門家です" in content,
-            "Context placeholder": "{context}" in content,
-            "Question placeholder": "{question}" in content,
-            "Structured output format": "レシピ名" in content and "材料リスト" in content,
-            "Recipe format specification": "調理手順" in content and "調理時間" in content,
-            "Fallback suggestions": "代替レシピ" in content,
-            "Template conditional creation": "if LANGCHAIN_AVAILABLE else None" in content,
-            "Chain prompt integration": "chain_type_kwargs" in content
-        }
-        
-        missing_features = []
-        for feature, present in prompt_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking prompt templates: {e}")
-        return False
+    return run_checks("Prompt Templates", 30, PROMPT_FEATURES, "prompt templates")
 
 def test_recipe_search_functionality():
     """Test recipe search and retrieval functionality."""
-    print("\n🧪 Testing Recipe Search Functionality")
-    print("=" * 45)
-    
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        search_features = {
-            "Search recipe method": "def search_recipe" in content,
-            "Dish name formatting": "_format_dish_query" in content,
-            "Multi-language queries": "のレシピ" in content and "recipe" in content,
-            "QA chain execution": "self.qa_chain" in content,
-            "Recipe info extraction": "_extract_recipe_info" in content,
-            "Answer validation": "_validate_retrieval_result" in content,
-            "Confidence scoring": "confidence_score" in content,
-            "Source limitation": "[:3]" in content,  # Limit to top 3 sources
-            "Processing time tracking": "processing_time" in content,
-            "Fallback error handling": "申し訳ございませんが" in content,
-            "Language parameter": "language: str = \"auto\"" in content,
-            "Recipe found detection": "recipe_found" in content
-        }
-        
-        missing_features = []
-        for feature, present in search_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking search functionality: {e}")
-        return False
+    return run_checks("Recipe Search Functionality", 45, SEARCH_FEATURES, "search functionality")
 
 def test_structured_output():
     """Test structured output and data processing."""
-    print("\n🧪 Testing Structured Output")
-    print("=" * 30)
-    
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        output_features = {
-            "Recipe found flag": "\"recipe_found\":" in content,
-            "Recipe name field": "\"recipe_name\":" in content,
-            "Answer field": "\"answer\":" in content,
-            "Ingredients list": "\"ingredients\":" in content,
-            "Instructions list": "\"instructions\":" in content,
-            "Confidence field": "\"confidence\":" in content,
-            "Sources array": "\"sources\":" in content,
-            "Processing time": "\"processing_time\":" in content,
-            "Timestamp": "\"timestamp\":" in content,
-            "Language field": "\"language\":" in content,
-            "Error field": "\"error\":" in content,
-            "Query used field": "\"query_used\":" in content,
-            "Source metadata": "doc.metadata" in content,
-            "Content truncation": "[:200]" in content  # Content limiting
-        }
-        
-        missing_features = []
-        for feature, present in output_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking structured output: {e}")
-        return False
+    return run_checks("Structured Output", 30, OUTPUT_FEATURES, "structured output")
 
 def test_error_handling():
     """Test error handling implementation."""
-    print("\n🧪 Testing Error Handling")
-    print("=" * 25)
-    
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        error_features = {
-            "Service availability check": "if not self.is_available():" in content,
-            "LangChain import error handling": "except ImportError" in content,
-            "Initialization error handling": "except Exception as e:" in content,
-            "Search error handling": "try:" in content and "except Exception as e:" in content,
-            "Configuration validation": "required_settings" in content,
-            "Graceful degradation": "Service not available" in content,
-            "User-friendly error messages": "申し訳ございませんが" in content,
-            "Error logging": "logger.error" in content,
-            "Component initialization check": "self._is_initialized" in content,
-            "Fallback responses": "recipe_found\": False" in content
-        }
-        
-        missing_features = []
-        for feature, present in error_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking error handling: {e}")
-        return False
+    return run_checks("Error Handling", 25, ERROR_FEATURES, "error handling")
 
 def test_observability_integration():
     """Test observability integration."""
-    print("\n🧪 Testing Observability Integration")
-    print("=" * 40)
-    
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        observability_features = {
-            "trace_function decorator": "@trace_function" in content,
-            "Observability imports": "obs_manager" in content,
-            "Metrics recording": "record_metric" in content,
-            "Search metrics": "rag_service_search" in content,
-            "Processing time metrics": "rag_service_processing_time" in content,
-            "Success/failure tracking": "\"success\": \"true\"" in content and "\"success\": \"false\"" in content,
-            "Confidence bucketing": "_get_confidence_bucket" in content,
-            "Operation classification": "\"operation\":" in content,
-            "Error categorization": "\"error\":" in content,
-            "Recipe found tracking": "\"recipe_found\":" in content,
-            "Language tracking": "\"language\":" in content,
-            "Processing time measurement": "time.time() - start_time" in content
-        }
-        
-        missing_features = []
-        for feature, present in observability_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking observability: {e}")
-        return False
+    return run_checks("Observability Integration", 40, OBSERVABILITY_FEATURES, "observability")
 
 def test_additional_features():
     """Test additional RAG service features."""
-    print("\n🧪 Testing Additional Features")
-    print("=" * 35)
-    
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        additional_features = {
-            "Service info method": "get_service_info" in content,
-            "Recipe listing": "list_available_recipes" in content,
-            "Similar recipe suggestions": "suggest_similar_recipes" in content,
-            "Connection testing": "test_connection" in content,
-            "Multi-language support": "supported_languages" in content,
-            "Confidence buckets": "high" in content and "medium" in content and "low" in content,
-            "S3 integration awareness": "S3_BUCKET_NAME" in content,
-            "PDF format support": "Dish Name].pdf" in content or "PDF" in content,
-            "Hybrid search configuration": "HYBRID" in content,
-            "Document limiting": "[:3]" in content and "[:10]" in content  # Source and ingredient limits
-        }
-        
-        missing_features = []
-        for feature, present in additional_features.items():
-            if present:
-                print(f"✅ {feature}")
-            else:
-                print(f"❌ {feature}")
-                missing_features.append(feature)
-        
-        return len(missing_features) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking additional features: {e}")
-        return False
+    return run_checks("Additional Features", 35, ADDITIONAL_FEATURES, "additional features")
 
 def test_method_signatures():
     """Test that method signatures match requirements."""
-    print("\n🧪 Testing Method Signatures")
-    print("=" * 30)
-    
-    try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        # Check key method signatures
-        signature_checks = {
-            "search_recipe": "def search_recipe(self, dish_name: str, language: str = \"auto\") -> Dict[str, Any]:" in content,
-            "is_available": "def is_available(self) -> bool:" in content,
-            "test_connection": "def test_connection(self) -> Dict[str, Any]:" in content,
-            "get_service_info": "def get_service_info(self) -> Dict[str, Any]:" in content,
-            "_format_dish_query": "def _format_dish_query(self, dish_name: str) -> str:" in content,
-            "_extract_recipe_info": "def _extract_recipe_info(self, documents: List[Document]) -> Dict[str, Any]:" in content
-        }
-        
-        missing_signatures = []
-        for method, present in signature_checks.items():
-            if present:
-                print(f"✅ {method} signature correct")
-            else:
-                print(f"❌ {method} signature incorrect")
-                missing_signatures.append(method)
-        
-        return len(missing_signatures) == 0
-        
-    except Exception as e:
-        print(f"❌ Error checking method signatures: {e}")
-        return False
+    return run_checks(
+        "Method Signatures", 30, SIGNATURE_CHECKS, "method signatures",
+        passed="{} signature correct", failed="{} signature incorrect"
+    )
+
+# Task 06 deliverables, in report order.
+DELIVERABLES = (
+    "RAGService class implementation with LangChain",  # Checked above
+    "Knowledge Base connection using LangChain retrievers",  # AmazonKnowledgeBasesRetriever
+    "Document retrieval functionality via LangChain",  # RetrievalQA chain
+    "Answer generation with LangChain QA chains",  # QA chain implementation
+    "S3 integration for PDF storage",  # S3 bucket configuration
+    "Fallback handling for missing recipes",  # Error handling
+    "LangChain prompt template optimization"  # Recipe-specific prompts
+)
 
 def test_task06_completeness():
     """Overall completeness check for Task 06."""
-    print("\n🧪 Testing Task 06 Completeness")
-    print("=" * 35)
-    
-    deliverables = {
-        "RAGService class implementation with LangChain": True,  # Checked above
-        "Knowledge Base connection using LangChain retrievers": True,  # AmazonKnowledgeBasesRetriever
-        "Document retrieval functionality via LangChain": True,  # RetrievalQA chain
-        "Answer generation with LangChain QA chains": True,  # QA chain implementation
-        "S3 integration for PDF storage": True,  # S3 bucket configuration
-        "Fallback handling for missing recipes": True,  # Error handling
-        "LangChain prompt template optimization": True   # Recipe-specific prompts
-    }
+    out = ["\n🧪 Testing Task 06 Completeness", "=" * 35]
     
     all_complete = True
-    for deliverable, status in deliverables.items():
-        if status:
-            print(f"✅ {deliverable}")
-        else:
-            print(f"❌ {deliverable}")
-            all_complete = False
+    out.extend(f"✅ {deliverable}" for deliverable in DELIVERABLES)
     
     # Check implementation details from requirements
     try:
-        with open("src/services/rag_service.py", "r") as f:
-            content = f.read()
-        
-        implementation_details = {
-            "LangChain with BedrockKnowledgeBasesRetriever": "AmazonKnowledgeBasesRetriever" in content,
-            "LangChain RetrievalQA chain integration": "RetrievalQA.from_chain_type" in content,
-            "Vector similarity search through LangChain": "vectorSearchConfiguration" in content,
-            "Document chunking and retrieval optimization": "numberOfResults" in content,
-            "Confidence scoring for retrieved documents": "confidence_score" in content,
-            "PDF recipe format support": "[Dish Name].pdf" in content or "PDF" in content,
-            "LangChain Bedrock LLM integration": "from langchain.llms.bedrock import Bedrock" in content,
-            "Recipe-specific prompt templates": "あなたは料理の専門家です" in content,
-            "Multi-language query handling": "のレシピ" in content and "recipe" in content,
-            "Comprehensive error handling": "is_available" in content and "LANGCHAIN_AVAILABLE" in content
-        }
-        
-        for detail, present in implementation_details.items():
-            if present:
-                print(f"✅ {detail}")
+        for detail, check in IMPLEMENTATION_DETAILS:
+            if _evaluate(check):
+                out.append(f"✅ {detail}")
             else:
-                print(f"❌ {detail}")
+                out.append(f"❌ {detail}")
                 all_complete = False
+                if FAIL_FAST:
+                    break
                 
     except Exception as e:
-        print(f"⚠️  Could not check implementation details: {e}")
+        out.append(f"⚠️  Could not check implementation details: {e}")
         all_complete = False
     
+    emit(out)
     return all_complete
 
+STAMP_FILE = results_cache_path("task06.stamp")
+
+def _stamp_key():
+    """Return the key of the current inputs, or None if a file is missing.
+    
+    It covers the source contents, the Python version and the mtimes of
+    this script and validation_helpers.py, so editing any of those files
+    or switching interpreters forces a run.
+    """
+    try:
+        digest = hashlib.sha256(_load_source())
+        script_mtime = os.stat(__file__).st_mtime_ns
+        helpers_mtime = os.stat(HELPERS_FILE).st_mtime_ns
+    except OSError:
+        return None
+    digest.update(f"{sys.version}|{script_mtime}|{helpers_mtime}".encode("utf-8"))
+    return digest.hexdigest()
+
+def _stamp_matches(key):
+    """Check whether the last passing run recorded the same key."""
+    if key is None:
+        return False
+    try:
+        with open(STAMP_FILE, "r") as f:
+            return f.read().strip() == key
+    except OSError:
+        return False
+
+# --json writes one machine-readable summary line and nothing else: the
+# per-test results, the pass rate, the overall verdict and whether it came
+# from the stamp cache. --quiet keeps the human summary but drops the
+# per-check report.
+JSON_OUTPUT = "--json" in sys.argv
+QUIET = JSON_OUTPUT or "--quiet" in sys.argv
+
 if __name__ == "__main__":
-    print("🧪 Task 06 Basic Validation: RAG System with Knowledge Base")
-    print("=" * 65)
+    if not JSON_OUTPUT:
+        print("🧪 Task 06 Basic Validation: RAG System with Knowledge Base")
+        print("=" * 65)
     
     tests = [
         ("Implementation Requirements", test_implementation_requirements),
@@ -465,45 +560,71 @@ if __name__ == "__main__":
         ("Task 06 Completeness", test_task06_completeness)
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ {test_name} failed with error: {e}")
-            results.append(False)
+    # Nothing to do if the last run passed against identical inputs.
+    stamp_key = _stamp_key()
+    if "--force" not in sys.argv and _stamp_matches(stamp_key):
+        if JSON_OUTPUT:
+            summary = {
+                "tests": {test_name: True for test_name, _ in tests},
+                "rate": 100,
+                "passed": True,
+                "cached": True
+            }
+            sys.stdout.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        else:
+            print("✅ cache hit: all checks passed and the source is unchanged")
+            print("   (run with --force to re-check)")
+        sys.exit(0)
+    
+    results = run_tests(tests, quiet=QUIET, max_workers=os.cpu_count())
+    all_passed = all(results)
+    success_rate = sum(results) / len(results) * 100
     
-    print("\n" + "=" * 65)
-    print("📊 SUMMARY")
-    print("=" * 65)
+    if all_passed and stamp_key is not None:
+        write_cache_file(STAMP_FILE, stamp_key)
     
-    for i, (test_name, _) in enumerate(tests):
-        status = "✅ PASS" if results[i] else "❌ FAIL"
-        print(f"{status} {test_name}")
+    if JSON_OUTPUT:
+        summary = {
+            "tests": dict(zip((test_name for test_name, _ in tests), results)),
+            "rate": round(success_rate),
+            "passed": all_passed,
+            "cached": False
+        }
+        sys.stdout.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        sys.exit(0 if all_passed else 1)
     
-    success_rate = sum(results) / len(results) * 100
-    print(f"\nOverall: {success_rate:.0f}% tests passed")
+    # Build the summary as one block so it goes out in a single write.
+    lines = ["", "=" * 65, "📊 SUMMARY", "=" * 65]
+    lines.extend(
+        f"{'✅ PASS' if results[i] else '❌ FAIL'} {test_name}"
+        for i, (test_name, _) in enumerate(tests)
+    )
     
-    if all(results):
-        print("\n🎉 Task 06 implementation is complete!")
-        print("✅ RAG System with Knowledge Base fully implemented with all requirements:")
-        print("   • LangChain integration with AmazonKnowledgeBasesRetriever")
-        print("   • RetrievalQA chain for context-aware answer generation")
-        print("   • AWS Bedrock Knowledge Base integration")
-        print("   • S3 bucket connection for PDF recipe storage")
-        print("   • Vector similarity search with hybrid configuration")
-        print("   • Multi-language support (Japanese/English)")
-        print("   • Recipe-specific prompt templates optimized for cooking")
-        print("   • Comprehensive error handling and fallback mechanisms")
-        print("   • OpenTelemetry observability integration with detailed metrics")
-        print("   • Structured output with ingredients, instructions, and confidence")
-        print("   • Document retrieval with source attribution")
-        print("   • Connection testing and service availability checks")
-        print("\nNote: Runtime testing requires LangChain, AWS Bedrock, and Knowledge Base setup.")
-        print("The implementation is structurally complete and ready for use.")
+    lines.append(f"\nOverall: {success_rate:.0f}% tests passed")
+    
+    if all_passed:
+        lines.extend([
+            "\n🎉 Task 06 implementation is complete!",
+            "✅ RAG System with Knowledge Base fully implemented with all requirements:",
+            "   • LangChain integration with AmazonKnowledgeBasesRetriever",
+            "   • RetrievalQA chain for context-aware answer generation",
+            "   • AWS Bedrock Knowledge Base integration",
+            "   • S3 bucket connection for PDF recipe storage",
+            "   • Vector similarity search with hybrid configuration",
+            "   • Multi-language support (Japanese/English)",
+            "   • Recipe-specific prompt templates optimized for cooking",
+            "   • Comprehensive error handling and fallback mechanisms",
+            "   • OpenTelemetry observability integration with detailed metrics",
+            "   • Structured output with ingredients, instructions, and confidence",
+            "   • Document retrieval with source attribution",
+            "   • Connection testing and service availability checks",
+            "\nNote: Runtime testing requires LangChain, AWS Bedrock, and Knowledge Base setup.",
+            "The implementation is structurally complete and ready for use."
+        ])
     else:
         failed_tests = [tests[i][0] for i, result in enumerate(results) if not result]
-        print(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
+        lines.append(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    sys.exit(0 if all(results) else 1)
\ No newline at end of file
+    sys.exit(0 if all_passed else 1)
\ No newline at end of file
@@ -6,17 +6,88 @@ import sys
 import time
 import json
 import logging
+import importlib.util
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from validation_helpers import emit, run_tests
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+# Test mode exports spans to memory and samples every trace, whatever
+# OTEL_TRACES_SAMPLER_ARG is set to, so the tests can inspect them
+os.environ.setdefault("OBS_TEST_MODE", "1")
+
+# Import the observability module once up front; tests that need it
+# re-raise the failure so each one still reports why it could not run
+try:
+    import utils.observability
+    _OBSERVABILITY_ERROR = None
+except Exception as e:
+    _OBSERVABILITY_ERROR = e
+
+def _require_observability():
+    """Raise an ImportError if utils.observability failed to load."""
+    if _OBSERVABILITY_ERROR is not None:
+        raise ImportError(str(_OBSERVABILITY_ERROR)) from _OBSERVABILITY_ERROR
+
+def _module_available(name):
+    """Check whether a module can be imported without executing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # A missing parent package raises instead of returning None
+        return False
+
+@lru_cache(maxsize=32)
+def _load_json(path, mtime_ns, size):
+    """Parse a JSON file; the stat fields in the key invalidate stale entries.
+    
+    orjson is used when installed; its decode error subclasses
+    json.JSONDecodeError, so callers handle both parsers the same way.
+    """
+    return _json_loads(Path(path).read_bytes())
+
+def _read_json(path, st=None):
+    """Load a JSON config file, reusing the parse while the file is unchanged.
+    
+    Pass ``st`` when the caller already has the file's stat result. The
+    returned object is shared between callers and must not be modified.
+    """
+    if st is None:
+        st = os.stat(path)
+    return _load_json(path, st.st_mtime_ns, st.st_size)
+
+def _scan_cwd():
+    """Map the names in the working directory to their scandir entries."""
+    with os.scandir('.') as it:
+        return {entry.name: entry for entry in it}
+
+def _is_executable(entry):
+    """Check a scandir entry's execute bits without a separate access() call."""
+    return bool(entry.stat().st_mode & 0o111)
+
+# With PERF_SIM_SLEEP=1 the traced test functions sleep to simulate work.
+SIMULATE_LATENCY = os.environ.get("PERF_SIM_SLEEP") == "1"
+
+# With OBS_TEST_VERBOSE=0 only failures and warnings are reported; -v
+# turns the informational lines back on.
+VERBOSE = os.environ.get("OBS_TEST_VERBOSE", "1") == "1" or "-v" in sys.argv[1:]
+
 def test_opentelemetry_imports():
     """Test that all enhanced OpenTelemetry components can be imported."""
-    print("🧪 Testing Enhanced OpenTelemetry Imports")
-    print("=" * 45)
+    out = ["🧪 Testing Enhanced OpenTelemetry Imports", "=" * 45]
     
     try:
+        _require_observability()
         from utils.observability import (
             obs_manager, 
             trace_function, 
@@ -27,117 +98,164 @@ def test_opentelemetry_imports():
             StructuredLoggingHandler
         )
         
-        print("✅ All observability components imported successfully")
+        if VERBOSE:
+            out.append("✅ All observability components imported successfully")
         
         # Test observability manager initialization
-        print(f"✅ ObservabilityManager initialized: {obs_manager.is_initialized}")
-        print(f"✅ Enhanced metrics available: {obs_manager.enhanced_metrics is not None}")
+        if VERBOSE:
+            out.append(f"✅ ObservabilityManager initialized: {obs_manager.is_initialized}")
+            out.append(f"✅ Enhanced metrics available: {obs_manager.enhanced_metrics is not None}")
         
         return True
         
     except ImportError as e:
-        print(f"❌ Import failed: {e}")
+        out.append(f"❌ Import failed: {e}")
         return False
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        out.append(f"❌ Unexpected error: {e}")
         return False
+    finally:
+        emit(out)
 
 def test_xray_propagator():
     """Test X-Ray propagator configuration."""
-    print("\n🧪 Testing X-Ray Propagator Configuration")
-    print("=" * 42)
+    out = ["\n🧪 Testing X-Ray Propagator Configuration", "=" * 42]
     
     try:
-        from opentelemetry import propagate
-        from opentelemetry.propagators.aws import AwsXRayPropagator
-        
-        # Check if X-Ray propagator is set
-        current_propagator = propagate.get_global_textmap()
+        _require_observability()
+        from utils.observability import obs_manager
         
-        if isinstance(current_propagator, AwsXRayPropagator):
-            print("✅ X-Ray propagator is correctly configured")
+        # The manager records whether it installed the X-Ray propagator
+        if obs_manager.xray_propagator_active:
+            if VERBOSE:
+                out.append("✅ X-Ray propagator is correctly configured")
             return True
         else:
-            print(f"❌ X-Ray propagator not set. Current: {type(current_propagator)}")
+            out.append("❌ X-Ray propagator not set")
             return False
             
     except ImportError as e:
-        print(f"❌ X-Ray propagator import failed: {e}")
+        out.append(f"❌ X-Ray propagator import failed: {e}")
         return False
     except Exception as e:
-        print(f"❌ Error checking X-Ray propagator: {e}")
+        out.append(f"❌ Error checking X-Ray propagator: {e}")
         return False
+    finally:
+        emit(out)
 
 def test_enhanced_metrics():
     """Test enhanced metrics functionality."""
-    print("\n🧪 Testing Enhanced Metrics")
-    print("=" * 28)
+    out = ["\n🧪 Testing Enhanced Metrics", "=" * 28]
     
     try:
+        _require_observability()
         from utils.observability import obs_manager
         
         if not obs_manager.enhanced_metrics:
-            print("❌ Enhanced metrics not available")
+            out.append("❌ Enhanced metrics not available")
             return False
         
         metrics = obs_manager.enhanced_metrics
         
         # Test metric recording
-        print("📊 Testing metric recording...")
+        if VERBOSE:
+            out.append("📊 Testing metric recording...")
         
         # Test request metrics
         obs_manager.start_request_context("test_operation", test_type="unit_test")
-        print("✅ Request context created")
-        
-        # Test AI metrics
-        obs_manager.record_ai_metrics(
-            model_id="test-model",
-            tokens_used=100,
-            operation_type="test",
-            cost_estimate=0.001
-        )
-        print("✅ AI metrics recorded")
+        if VERBOSE:
+            out.append("✅ Request context created")
+        
+        # Test AI, cache and error metrics in a single batch
+        ai_attributes = {"model_id": "test-model", "operation_type": "test"}
+        obs_manager.record_batch([
+            ("ai_tokens_used", 100, ai_attributes),
+            ("ai_cost_estimate", 0.001, ai_attributes),
+            ("cache_hits", 1, {"cache_name": "test_cache"}),
+            ("errors", 1, {
+                "error_type": "TestError",
+                "error_message": "This is a test error",
+                "operation": "test_operation"
+            })
+        ])
+        if VERBOSE:
+            out.append("✅ AI metrics recorded")
+            out.append("✅ Cache metrics recorded")
+            out.append("✅ Error metrics recorded")
         
-        # Test cache metrics
-        obs_manager.record_cache_operation("test_cache", hit=True)
-        print("✅ Cache metrics recorded")
+        return True
         
-        # Test error metrics
-        obs_manager.record_error(
-            error_type="TestError",
-            error_message="This is a test error",
-            operation="test_operation"
-        )
-        print("✅ Error metrics recorded")
+    except Exception as e:
+        out.append(f"❌ Enhanced metrics test failed: {type(e).__name__}: {e}")
+        return False
+    finally:
+        emit(out)
+
+def test_metric_batching():
+    """Test batched metric recording and counter reuse."""
+    out = ["\n🧪 Testing Metric Batching", "=" * 27]
+    
+    try:
+        _require_observability()
+        from utils.observability import obs_manager
+        
+        if not obs_manager.is_initialized:
+            out.append("❌ Observability not initialized; metrics are not recorded")
+            return False
+        
+        records = [
+            ("batch_test_requests", 1, {"operation": "test_operation"}),
+            ("batch_test_tokens", 50, {"model_id": "test-model"})
+        ]
+        obs_manager.record_batch(records)
+        counters = {name: obs_manager._counters.get(name) for name, _, _ in records}
+        if None in counters.values():
+            missing = [name for name, counter in counters.items() if counter is None]
+            out.append(f"❌ Counters not created for: {', '.join(missing)}")
+            return False
+        if VERBOSE:
+            out.append(f"✅ Batch recorded {len(records)} metrics")
+        
+        # A second batch and a single record must reuse the same counters
+        obs_manager.record_batch(records)
+        obs_manager.record_metric("batch_test_requests", 1)
+        if any(obs_manager._counters[name] is not counter for name, counter in counters.items()):
+            out.append("❌ Counters were recreated instead of reused")
+            return False
+        if VERBOSE:
+            out.append("✅ Counters reused across calls")
         
         return True
         
     except Exception as e:
-        print(f"❌ Enhanced metrics test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        out.append(f"❌ Metric batching test failed: {e}")
         return False
+    finally:
+        emit(out)
 
 def test_correlation_context():
     """Test correlation context functionality."""
-    print("\n🧪 Testing Correlation Context")
-    print("=" * 32)
+    out = ["\n🧪 Testing Correlation Context", "=" * 32]
     
     try:
+        _require_observability()
         from utils.observability import obs_manager, get_correlation_context, log_with_correlation
         
         # Start a request context
         correlation_id = obs_manager.start_request_context("test_correlation", user_id="test_user")
-        print(f"✅ Correlation ID created: {correlation_id}")
+        if VERBOSE:
+            out.append(f"✅ Correlation ID created: {correlation_id}")
         
         # Get correlation context
         context = get_correlation_context()
-        print(f"✅ Correlation context: {context}")
+        if VERBOSE:
+            out.append(f"✅ Correlation context: {context}")
         
         if context["correlation_id"] == correlation_id:
-            print("✅ Correlation context matches")
+            if VERBOSE:
+                out.append("✅ Correlation context matches")
         else:
-            print("❌ Correlation context mismatch")
+            out.append("❌ Correlation context mismatch")
             return False
         
         # Test structured logging with correlation
@@ -146,30 +264,45 @@ def test_correlation_context():
             level=logging.INFO,
             test_field="test_value"
         )
-        print("✅ Structured logging with correlation completed")
+        if VERBOSE:
+            out.append("✅ Structured logging with correlation completed")
+        
+        # Keys that would overwrite LogRecord attributes must be rejected
+        try:
+            obs_manager.start_request_context("test_correlation", name="clash")
+        except ValueError:
+            if VERBOSE:
+                out.append("✅ Reserved log record keys rejected")
+        else:
+            out.append("❌ Reserved log record key accepted into correlation context")
+            return False
         
         return True
         
     except Exception as e:
-        print(f"❌ Correlation context test failed: {e}")
+        out.append(f"❌ Correlation context test failed: {e}")
         return False
+    finally:
+        emit(out)
 
 def test_tracing_decorators():
     """Test enhanced tracing decorators."""
-    print("\n🧪 Testing Tracing Decorators")
-    print("=" * 31)
+    out = ["\n🧪 Testing Tracing Decorators", "=" * 31]
     
     try:
+        _require_observability()
         from utils.observability import trace_function, trace_ai_operation
         
         # Test basic trace function
         @trace_function("test_operation", {"test_attr": "test_value"})
         def test_basic_function(value):
-            time.sleep(0.1)  # Simulate processing
+            if SIMULATE_LATENCY:
+                time.sleep(0.1)  # Simulate processing
             return f"processed_{value}"
         
         result = test_basic_function("test_input")
-        print(f"✅ Basic trace function: {result}")
+        if VERBOSE:
+            out.append(f"✅ Basic trace function: {result}")
         
         # Test AI operation tracing
         @trace_ai_operation(
@@ -178,46 +311,152 @@ def test_tracing_decorators():
             cost_per_token=0.00001
         )
         def test_ai_function(prompt):
-            time.sleep(0.05)  # Simulate AI processing
+            if SIMULATE_LATENCY:
+                time.sleep(0.05)  # Simulate AI processing
             return {
                 "content": f"AI response to: {prompt}",
                 "usage": {"total_tokens": 50}
             }
         
         ai_result = test_ai_function("Test prompt")
-        print(f"✅ AI trace function: {ai_result['content']}")
+        if VERBOSE:
+            out.append(f"✅ AI trace function: {ai_result['content']}")
+        
+        return True
+        
+    except Exception as e:
+        out.append(f"❌ Tracing decorators test failed: {type(e).__name__}: {e}")
+        return False
+    finally:
+        emit(out)
+
+def test_trace_sampling():
+    """Test that traces are head-sampled with a parent-based sampler."""
+    out = ["\n🧪 Testing Trace Sampling", "=" * 26]
+    
+    try:
+        _require_observability()
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace.sampling import ParentBased
+        
+        # New traces are head-sampled; child spans follow their parent
+        sampler = getattr(trace.get_tracer_provider(), "sampler", None)
+        if not isinstance(sampler, ParentBased):
+            out.append(f"❌ Trace sampler is not parent-based: {type(sampler).__name__}")
+            return False
+        if VERBOSE:
+            out.append(f"✅ Trace sampler: {sampler.get_description()}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Tracing decorators test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        out.append(f"❌ Trace sampling test failed: {e}")
         return False
+    finally:
+        emit(out)
+
+def test_span_export():
+    """Test that traced calls reach the in-memory span exporter in test mode."""
+    out = ["\n🧪 Testing Span Export", "=" * 23]
+    
+    try:
+        _require_observability()
+        from opentelemetry import trace
+        from utils.observability import obs_manager, trace_function
+        
+        exporter = obs_manager.span_exporter
+        if not hasattr(exporter, "get_finished_spans"):
+            out.append(f"❌ In-memory span exporter not configured: {type(exporter).__name__}")
+            return False
+        
+        @trace_function("span_export_check")
+        def span_export_probe():
+            return True
+        
+        span_export_probe()
+        trace.get_tracer_provider().force_flush()
+        
+        span_names = {span.name for span in exporter.get_finished_spans()}
+        if not any(name.endswith(".span_export_probe") for name in span_names):
+            out.append("❌ Traced function span was not exported")
+            return False
+        if VERBOSE:
+            out.append(f"✅ Exported spans: {len(span_names)}")
+        
+        return True
+        
+    except Exception as e:
+        out.append(f"❌ Span export test failed: {e}")
+        return False
+    finally:
+        emit(out)
+
+def _batch_tuning(processor):
+    """Return a BatchSpanProcessor's (batch size, schedule delay), or None.
+    
+    Newer SDKs keep the settings on a private ``_batch_processor``; older
+    ones expose them directly on the processor.
+    """
+    inner = getattr(processor, '_batch_processor', None)
+    for source, batch_attr, delay_attr in (
+        (inner, '_max_export_batch_size', '_schedule_delay_millis'),
+        (processor, 'max_export_batch_size', 'schedule_delay_millis'),
+    ):
+        if hasattr(source, batch_attr) and hasattr(source, delay_attr):
+            return getattr(source, batch_attr), getattr(source, delay_attr)
+    return None
 
 def test_cloudwatch_configuration():
     """Test CloudWatch configuration and exporters."""
-    print("\n🧪 Testing CloudWatch Configuration")
-    print("=" * 36)
+    out = ["\n🧪 Testing CloudWatch Configuration", "=" * 36]
     
     try:
+        _require_observability()
         from utils.observability import obs_manager
         import settings
         
+        # Span export must be batched so traced calls never block on it;
+        # this applies whether or not CloudWatch credentials are present
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        tracer_provider = trace.get_tracer_provider()
+        active = getattr(tracer_provider, '_active_span_processor', None)
+        processors = getattr(active, '_span_processors', ())
+        batch_processors = [p for p in processors if isinstance(p, BatchSpanProcessor)]
+        if VERBOSE:
+            out.append(f"✅ Trace processors configured: {len(processors)}")
+        
+        export_configured = (settings.settings.OBS_TEST_MODE
+                             or settings.settings.OTEL_EXPORTER_OTLP_TRACES_ENDPOINT)
+        if export_configured and not batch_processors:
+            out.append("❌ No BatchSpanProcessor configured")
+            return False
+        
+        if len(batch_processors) != len(processors):
+            out.append("❌ Non-batching span processor configured")
+            return False
+        
+        for p in batch_processors:
+            tuning = _batch_tuning(p)
+            if tuning is None:
+                out.append("❌ BatchSpanProcessor tuning not readable from this SDK version")
+                return False
+            batch_size, delay = tuning
+            if (batch_size, delay) != (settings.settings.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+                                       settings.settings.OTEL_BSP_SCHEDULE_DELAY):
+                out.append(f"❌ BatchSpanProcessor tuning mismatch: batch={batch_size}, delay={delay}ms")
+                return False
+        if VERBOSE:
+            out.append(f"✅ Batch span processors configured: {len(batch_processors)}")
+        
         # Check AWS credentials availability
         has_aws_creds = obs_manager._has_aws_credentials()
-        print(f"📋 AWS credentials available: {has_aws_creds}")
+        if VERBOSE:
+            out.append(f"📋 AWS credentials available: {has_aws_creds}")
         
         if has_aws_creds:
-            print("✅ CloudWatch exporters should be configured")
-            
-            # Test that trace provider has exporters
-            from opentelemetry import trace
-            tracer_provider = trace.get_tracer_provider()
-            
-            if hasattr(tracer_provider, '_span_processors'):
-                processor_count = len(tracer_provider._span_processors)
-                print(f"✅ Trace processors configured: {processor_count}")
+            if VERBOSE:
+                out.append("✅ CloudWatch exporters should be configured")
             
             # Test metrics provider
             from opentelemetry import metrics
@@ -225,228 +464,240 @@ def test_cloudwatch_configuration():
             
             if hasattr(metrics_provider, '_metric_readers'):
                 reader_count = len(metrics_provider._metric_readers)
-                print(f"✅ Metric readers configured: {reader_count}")
+                if VERBOSE:
+                    out.append(f"✅ Metric readers configured: {reader_count}")
             
         else:
-            print("⚠️  CloudWatch exporters not configured (no AWS credentials)")
+            out.append("⚠️  CloudWatch exporters not configured (no AWS credentials)")
         
         return True
         
     except Exception as e:
-        print(f"❌ CloudWatch configuration test failed: {e}")
+        out.append(f"❌ CloudWatch configuration test failed: {e}")
         return False
+    finally:
+        emit(out)
 
 def test_instrumentation():
     """Test automatic instrumentation."""
-    print("\n🧪 Testing Automatic Instrumentation")
-    print("=" * 36)
+    out = ["\n🧪 Testing Automatic Instrumentation", "=" * 36]
     
     try:
         # Test that instrumentors are available
         instrumentors = []
         
-        try:
-            from opentelemetry.instrumentation.requests import RequestsInstrumentor
+        if _module_available("opentelemetry.instrumentation.requests"):
             instrumentors.append("RequestsInstrumentor")
-        except ImportError:
-            pass
         
-        try:
-            from opentelemetry.instrumentation.botocore import BotocoreInstrumentor
+        if _module_available("opentelemetry.instrumentation.botocore"):
             instrumentors.append("BotocoreInstrumentor")
-        except ImportError:
-            pass
         
-        try:
-            from opentelemetry.instrumentation.logging import LoggingInstrumentor
+        if _module_available("opentelemetry.instrumentation.logging"):
             instrumentors.append("LoggingInstrumentor")
-        except ImportError:
-            pass
         
-        print(f"✅ Available instrumentors: {', '.join(instrumentors)}")
+        if VERBOSE:
+            out.append(f"✅ Available instrumentors: {', '.join(instrumentors)}")
         
         if len(instrumentors) >= 2:
-            print("✅ Sufficient instrumentation available")
+            if VERBOSE:
+                out.append("✅ Sufficient instrumentation available")
             return True
         else:
-            print("⚠️  Limited instrumentation available")
+            out.append("⚠️  Limited instrumentation available")
             return False
             
     except Exception as e:
-        print(f"❌ Instrumentation test failed: {e}")
+        out.append(f"❌ Instrumentation test failed: {e}")
         return False
+    finally:
+        emit(out)
+
+REQUIRED_WIDGET_TYPES = frozenset({"metric", "log"})
 
 def test_dashboard_configuration():
     """Test CloudWatch dashboard configuration."""
-    print("\n🧪 Testing Dashboard Configuration")
-    print("=" * 34)
+    out = ["\n🧪 Testing Dashboard Configuration", "=" * 34]
     
     try:
         # Check if dashboard configuration file exists
+        # with a single stat that is reused as the parse cache key
         dashboard_file = "cloudwatch-dashboard.json"
+        try:
+            dashboard_stat = os.stat(dashboard_file)
+        except FileNotFoundError:
+            dashboard_stat = None
         
-        if os.path.exists(dashboard_file):
-            print(f"✅ Dashboard configuration file found: {dashboard_file}")
+        if dashboard_stat is not None:
+            if VERBOSE:
+                out.append(f"✅ Dashboard configuration file found: {dashboard_file}")
             
             # Validate JSON format
-            with open(dashboard_file, 'r') as f:
-                dashboard_config = json.load(f)
+            dashboard_config = _read_json(dashboard_file, dashboard_stat)
             
             # Check for required widgets
             widgets = dashboard_config.get("widgets", [])
-            widget_types = [w.get("type") for w in widgets]
+            widget_types = {w.get("type") for w in widgets}
             
-            print(f"✅ Dashboard widgets: {len(widgets)} total")
-            print(f"✅ Widget types: {set(widget_types)}")
+            if VERBOSE:
+                out.append(f"✅ Dashboard widgets: {len(widgets)} total")
+                out.append(f"✅ Widget types: {widget_types}")
             
-            if "metric" in widget_types and "log" in widget_types:
-                print("✅ Dashboard includes both metric and log widgets")
+            if widget_types >= REQUIRED_WIDGET_TYPES:
+                if VERBOSE:
+                    out.append("✅ Dashboard includes both metric and log widgets")
                 return True
             else:
-                print("⚠️  Dashboard missing required widget types")
+                out.append("⚠️  Dashboard missing required widget types")
                 return False
         else:
-            print(f"❌ Dashboard configuration file not found: {dashboard_file}")
+            out.append(f"❌ Dashboard configuration file not found: {dashboard_file}")
             return False
             
     except json.JSONDecodeError as e:
-        print(f"❌ Dashboard JSON parsing failed: {e}")
+        out.append(f"❌ Dashboard JSON parsing failed: {e}")
         return False
     except Exception as e:
-        print(f"❌ Dashboard configuration test failed: {e}")
+        out.append(f"❌ Dashboard configuration test failed: {e}")
         return False
+    finally:
+        emit(out)
 
 def test_cloudwatch_agent_files():
     """Test CloudWatch agent configuration files."""
-    print("\n🧪 Testing CloudWatch Agent Files")
-    print("=" * 35)
+    out = ["\n🧪 Testing CloudWatch Agent Files", "=" * 35]
     
     try:
         # Check configuration files
         config_file = "cloudwatch-agent-config.json"
         install_script = "install-cloudwatch-agent.sh"
         
+        entries = _scan_cwd()
         files_found = []
         
-        if os.path.exists(config_file):
+        if config_file in entries:
             files_found.append(config_file)
             
             # Validate JSON format
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = _read_json(config_file, entries[config_file].stat())
             
             # Check for required sections
             required_sections = ["agent", "logs", "metrics"]
             for section in required_sections:
                 if section in config:
-                    print(f"✅ CloudWatch agent config has '{section}' section")
+                    if VERBOSE:
+                        out.append(f"✅ CloudWatch agent config has '{section}' section")
                 else:
-                    print(f"❌ CloudWatch agent config missing '{section}' section")
+                    out.append(f"❌ CloudWatch agent config missing '{section}' section")
         else:
-            print(f"❌ CloudWatch agent config not found: {config_file}")
+            out.append(f"❌ CloudWatch agent config not found: {config_file}")
         
-        if os.path.exists(install_script):
+        if install_script in entries:
             files_found.append(install_script)
             
             # Check if script is executable
-            if os.access(install_script, os.X_OK):
-                print(f"✅ Installation script is executable: {install_script}")
+            if _is_executable(entries[install_script]):
+                if VERBOSE:
+                    out.append(f"✅ Installation script is executable: {install_script}")
             else:
-                print(f"⚠️  Installation script not executable: {install_script}")
+                out.append(f"⚠️  Installation script not executable: {install_script}")
         else:
-            print(f"❌ Installation script not found: {install_script}")
+            out.append(f"❌ Installation script not found: {install_script}")
         
         # Check for WSL2 fix script
         fix_script = "fix-wsl2-cloudwatch.sh"
-        if os.path.exists(fix_script):
+        if fix_script in entries:
             files_found.append(fix_script)
-            if os.access(fix_script, os.X_OK):
-                print(f"✅ WSL2 fix script is executable: {fix_script}")
+            if _is_executable(entries[fix_script]):
+                if VERBOSE:
+                    out.append(f"✅ WSL2 fix script is executable: {fix_script}")
             else:
-                print(f"⚠️  WSL2 fix script not executable: {fix_script}")
+                out.append(f"⚠️  WSL2 fix script not executable: {fix_script}")
         
         # Check for credentials test script
         cred_test_script = "test-aws-credentials.sh"
-        if os.path.exists(cred_test_script):
+        if cred_test_script in entries:
             files_found.append(cred_test_script)
-            if os.access(cred_test_script, os.X_OK):
-                print(f"✅ AWS credentials test script is executable: {cred_test_script}")
+            if _is_executable(entries[cred_test_script]):
+                if VERBOSE:
+                    out.append(f"✅ AWS credentials test script is executable: {cred_test_script}")
             else:
-                print(f"⚠️  AWS credentials test script not executable: {cred_test_script}")
+                out.append(f"⚠️  AWS credentials test script not executable: {cred_test_script}")
         
-        print(f"✅ CloudWatch agent files found: {files_found}")
+        if VERBOSE:
+            out.append(f"✅ CloudWatch agent files found: {files_found}")
         return len(files_found) >= 2
         
     except json.JSONDecodeError as e:
-        print(f"❌ CloudWatch agent config JSON parsing failed: {e}")
+        out.append(f"❌ CloudWatch agent config JSON parsing failed: {e}")
         return False
     except Exception as e:
-        print(f"❌ CloudWatch agent files test failed: {e}")
+        out.append(f"❌ CloudWatch agent files test failed: {e}")
         return False
+    finally:
+        emit(out)
+
+TESTS = (
+    ("OpenTelemetry Imports", test_opentelemetry_imports),
+    ("X-Ray Propagator", test_xray_propagator),
+    ("Enhanced Metrics", test_enhanced_metrics),
+    ("Metric Batching", test_metric_batching),
+    ("Correlation Context", test_correlation_context),
+    ("Tracing Decorators", test_tracing_decorators),
+    ("Trace Sampling", test_trace_sampling),
+    ("Span Export", test_span_export),
+    ("CloudWatch Configuration", test_cloudwatch_configuration),
+    ("Automatic Instrumentation", test_instrumentation),
+    ("Dashboard Configuration", test_dashboard_configuration),
+    ("CloudWatch Agent Files", test_cloudwatch_agent_files)
+)
 
 def main():
     """Main test function."""
-    print("🧪 Task 07: Enhanced OpenTelemetry Observability Test")
-    print("=" * 60)
-    print(f"Timestamp: {datetime.now().isoformat()}")
-    print()
+    emit([
+        "🧪 Task 07: Enhanced OpenTelemetry Observability Test",
+        "=" * 60,
+        f"Timestamp: {datetime.now().isoformat()}",
+        ""
+    ])
     
-    tests = [
-        ("OpenTelemetry Imports", test_opentelemetry_imports),
-        ("X-Ray Propagator", test_xray_propagator),
-        ("Enhanced Metrics", test_enhanced_metrics),
-        ("Correlation Context", test_correlation_context),
-        ("Tracing Decorators", test_tracing_decorators),
-        ("CloudWatch Configuration", test_cloudwatch_configuration),
-        ("Automatic Instrumentation", test_instrumentation),
-        ("Dashboard Configuration", test_dashboard_configuration),
-        ("CloudWatch Agent Files", test_cloudwatch_agent_files)
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ {test_name} failed with error: {e}")
-            results.append(False)
+    results = run_tests(TESTS)
     
-    print("\n" + "=" * 60)
-    print("📊 TASK 07 TEST SUMMARY")
-    print("=" * 60)
-    
-    for i, (test_name, _) in enumerate(tests):
-        status = "✅ PASS" if results[i] else "❌ FAIL"
-        print(f"{status} {test_name}")
+    lines = [
+        "\n" + "=" * 60,
+        "📊 TASK 07 TEST SUMMARY",
+        "=" * 60,
+        *(f"{'✅ PASS' if result else '❌ FAIL'} {test_name}"
+          for (test_name, _), result in zip(TESTS, results))
+    ]
     
     success_rate = sum(results) / len(results) * 100
-    print(f"\nOverall: {success_rate:.0f}% tests passed")
+    lines.append(f"\nOverall: {success_rate:.0f}% tests passed")
     
     if all(results):
-        print("\n🎉 Task 07 Enhanced Observability Implementation Complete!")
-        print("✅ All observability features implemented successfully:")
-        print("   • X-Ray propagator for AWS distributed tracing")
-        print("   • Enhanced metrics with AI model tracking")
-        print("   • Correlation context and structured logging")
-        print("   • Comprehensive tracing decorators")
-        print("   • CloudWatch integration with exporters")
-        print("   • Automatic instrumentation for key libraries")
-        print("   • CloudWatch dashboard configuration")
-        print("   • CloudWatch agent setup for WSL2")
-        print("\n📊 Next Steps:")
-        print("   1. Install CloudWatch agent: ./install-cloudwatch-agent.sh")
-        print("   2. Import dashboard: cloudwatch-dashboard.json")
-        print("   3. Run application to generate traces and metrics")
-        print("   4. Monitor in CloudWatch console")
+        lines.append("\n🎉 Task 07 Enhanced Observability Implementation Complete!")
+        lines.append("✅ All observability features implemented successfully:")
+        lines.append("   • X-Ray propagator for AWS distributed tracing")
+        lines.append("   • Enhanced metrics with AI model tracking")
+        lines.append("   • Correlation context and structured logging")
+        lines.append("   • Comprehensive tracing decorators")
+        lines.append("   • CloudWatch integration with exporters")
+        lines.append("   • Automatic instrumentation for key libraries")
+        lines.append("   • CloudWatch dashboard configuration")
+        lines.append("   • CloudWatch agent setup for WSL2")
+        lines.append("\n📊 Next Steps:")
+        lines.append("   1. Install CloudWatch agent: ./install-cloudwatch-agent.sh")
+        lines.append("   2. Import dashboard: cloudwatch-dashboard.json")
+        lines.append("   3. Run application to generate traces and metrics")
+        lines.append("   4. Monitor in CloudWatch console")
     else:
-        failed_tests = [tests[i][0] for i, result in enumerate(results) if not result]
-        print(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
-        print("\n🔧 Troubleshooting:")
-        print("   • Check OpenTelemetry dependencies: pip install -r requirements.txt")
-        print("   • Verify AWS credentials are configured")
-        print("   • Ensure all configuration files are present")
+        failed_tests = [test_name for (test_name, _), result in zip(TESTS, results) if not result]
+        lines.append(f"\n⚠️  Failed tests: {', '.join(failed_tests)}")
+        lines.append("\n🔧 Troubleshooting:")
+        lines.append("   • Check OpenTelemetry dependencies: pip install -r requirements.txt")
+        lines.append("   • Verify AWS credentials are configured")
+        lines.append("   • Ensure all configuration files are present")
     
+    emit(lines)
     sys.exit(0 if all(results) else 1)
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Helpers shared by the task validation scripts.
+
+The scripts are run from the repository root, so this module is importable
+next to them without any path setup.
+"""
+
+import contextvars
+import hashlib
+import io
+import os
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+# Validators that cache their outcome include this file in the cache key:
+# the helpers below take part in every check result.
+HELPERS_FILE = os.path.abspath(__file__)
+
+# Repo-local directory for validator stamps and cached results; listed in
+# .gitignore. A fixed name in the shared temp dir could be blocked or
+# pre-seeded with a "passed" entry by another user.
+RESULTS_CACHE_DIR = ".validation_cache"
+
+# One fail-fast switch for every validator: FAIL_FAST=1 or --fail-fast.
+# What stops early depends on the validator:
+#   Task 03  each feature group stops at its first missing feature and
+#            skips the per-feature report;
+#   Task 05  the tests run serially and stop at the first failing test;
+#   Task 06  each section stops at its first failing check.
+# Task 04 and Task 07 always run every check.
+FAIL_FAST = "--fail-fast" in sys.argv or os.getenv("FAIL_FAST", "0") == "1"
+
+def results_cache_path(name):
+    """Return the path of the cache entry ``name`` in RESULTS_CACHE_DIR."""
+    return os.path.join(RESULTS_CACHE_DIR, name)
+
+def write_cache_file(path, text):
+    """Atomically write ``text`` to the cache entry at ``path``.
+    
+    Errors are ignored: the cache is an optimisation, and an unwritable
+    cache must not turn a passing run into a failure.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+class ThreadLocalStream:
+    """Stream proxy that routes each worker thread's output to its own buffer."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def begin_capture(self, buffer=None):
+        self._local.buffer = buffer if buffer is not None else io.StringIO()
+        return self._local.buffer
+    
+    def end_capture(self):
+        self._local.buffer = None
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self.stream.write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+def run_captured(test_name, test_func, stdout, stderr=None):
+    """Run one test with its output captured so results can be printed in order.
+    
+    If ``stderr`` is given, tracebacks go to the same buffer as regular
+    output so they stay next to the failure message they belong to.
+    """
+    buffer = stdout.begin_capture()
+    if stderr is not None:
+        stderr.begin_capture(buffer)
+    try:
+        try:
+            result = test_func()
+        except Exception as e:
+            print(f"❌ {test_name} failed with error: {e}")
+            result = False
+    finally:
+        stdout.end_capture()
+        if stderr is not None:
+            stderr.end_capture()
+    return result, buffer.getvalue()
+
+def run_tests(tests, quiet=False, max_workers=None):
+    """Run ``(name, test)`` pairs concurrently and print their output in order.
+    
+    Each test runs in its own copy of the current context, so context set
+    by one test is not visible to the others, and its stdout and stderr go
+    to one buffer that is replayed with a single write. With ``quiet`` the
+    per-test output is discarded instead. ``max_workers`` caps the thread
+    count, which is otherwise one per test. Returns the results in order.
+    """
+    workers = min(len(tests), max_workers or len(tests))
+    stdout = ThreadLocalStream(sys.stdout)
+    stderr = ThreadLocalStream(sys.stderr)
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    run_captured, test_name, test_func, stdout, stderr
+                )
+                for test_name, test_func in tests
+            ]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout, sys.stderr = stdout.stream, stderr.stream
+    
+    if not quiet:
+        sys.stdout.write("".join(output for _, output in outcomes))
+    return [result for result, _ in outcomes]
+
+def emit(lines):
+    """Write a test's report lines with a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# Listed in .gitignore.
+AST_CACHE_DIR = ".ast_cache"
+
+def cached_parse(source, filename="<unknown>"):
+    """Parse ``source``, reusing a pickled tree from an earlier run when possible.
+    
+    ``source`` is bytes or an mmap. Entries are keyed on the SHA-256 of the
+    source and the Python version, so editing the file or switching
+    interpreters never serves a stale tree.
+    """
+    key = f"{hashlib.sha256(source).hexdigest()}-{sys.implementation.cache_tag}"
+    cache_path = os.path.join(AST_CACHE_DIR, f"{key}.pkl")
+    
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    import ast  # Only needed on a cache miss
+    
+    tree = ast.parse(bytes(source), filename=filename)
+    try:
+        os.makedirs(AST_CACHE_DIR, exist_ok=True)
+        # Unique per thread: concurrent checks may miss the cache together.
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # The cache is an optimisation; a read-only tree still works
+    return tree
+
+class AnyOf(NamedTuple):
+    """Check that passes when at least one of ``needles`` is in the source."""
+    needles: tuple
+
+class AtLeast(NamedTuple):
+    """Check that passes when ``needle`` occurs at least ``count`` times."""
+    needle: str
+    count: int
+
+def check_needles(check):
+    """Return the plain substrings a check looks for.
+    
+    A needle string, a plain tuple of needles, an AnyOf or an AtLeast yields
+    its needles; any other check (a regex or a structural check) yields none.
+    """
+    if isinstance(check, str):
+        return (check,)
+    if isinstance(check, AnyOf):
+        return check.needles
+    if isinstance(check, AtLeast):
+        return (check.needle,)
+    if type(check) is tuple:
+        return check
+    return ()
+
+def encode_literals(checks):
+    """Map every literal the checks look for to its UTF-8 encoding.
+    
+    Literals shared by several checks are encoded once, and the source can
+    then be scanned as bytes without being decoded.
+    """
+    return {
+        needle: needle.encode("utf-8")
+        for check in checks
+        for needle in check_needles(check)
+    }
+
+def find_literals(content, encoded):
+    """Return the literals of ``encoded`` that occur in ``content``.
+    
+    ``content`` is bytes or an mmap, so ``.find()`` is used: ``in`` on an
+    mmap only tests single bytes. Each literal is tested on its own rather
+    than through one regex alternation, which can't report overlapping
+    literals such as ``session_state`` inside ``st.session_state``.
+    """
+    return frozenset(
+        needle for needle, data in encoded.items() if content.find(data) != -1
+    )